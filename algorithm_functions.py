@@ -1,11 +1,67 @@
-def selection_sort(arr):
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def sort_by_key(sort_fn, arr, key=None, reverse=False):
+    # Decorate-sort-undecorate for the comparison sorts. key is called once
+    # per element, sort_fn sorts (key, index) pairs and arr is rebuilt from
+    # the indices. The index breaks ties, so the result is stable whatever
+    # sort_fn is; for reverse the index is negated and the sorted pairs are
+    # read backwards, which keeps equal keys in their original order too.
+    values = list(arr)
+    keys = values if key is None else [key(x) for x in values]
+    sign = -1 if reverse else 1
+    decorated = [(k, sign * i) for i, k in enumerate(keys)]
+    sort_fn(decorated)
+    if reverse:
+        decorated.reverse()
+    result = [values[sign * i] for _, i in decorated]
+    arr[:] = array(arr.typecode, result) if isinstance(arr, array) else result
+    return arr
+
+def numeric_keys(arr, key=None, reverse=False):
+    # Keys for the distribution sorts, computed once. Negating them turns a
+    # stable ascending sort into a stable descending one.
+    keys = list(arr) if key is None else [key(x) for x in arr]
+    if reverse:
+        keys = [-k for k in keys]
+    return keys
+
+def scratch(arr, n):
+    # Work space of n items for a sort of arr: a list, or for typed buffers
+    # (array.array, memoryview) a zeroed buffer of the same item type, so
+    # that values are never boxed into a list.
+    if isinstance(arr, array):
+        return array(arr.typecode, bytes(arr.itemsize * n))
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(arr.itemsize * n)).cast(arr.format)
+    return [None] * n
+
+def copy_range(arr, lo, hi):
+    # arr[lo:hi] as a copy; slicing a memoryview only makes another view.
+    part = arr[lo:hi]
+    if isinstance(part, memoryview):
+        return memoryview(part.tobytes()).cast(part.format)
+    return part
+
+# Usage:
+# records = [("bob", 3), ("amy", 1), ("cat", 3)]
+# merge_sort(records, key=lambda r: r[1], reverse=True)
+# print(records)  # [('bob', 3), ('cat', 3), ('amy', 1)]
+
+
+
+def selection_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(selection_sort, arr, key, reverse)
     n = len(arr)
     for i in range(n):
         min_index = i
         for j in range(i + 1, n):
             if arr[j] < arr[min_index]:
                 min_index = j
-        arr[i], arr[min_index] = arr[min_index], arr[i]
+        if min_index != i:
+            arr[i], arr[min_index] = arr[min_index], arr[i]
     return arr
 
 # Usage:
@@ -15,7 +71,9 @@ def selection_sort(arr):
 
 
 
-def bubble_sort(arr):
+def bubble_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(bubble_sort, arr, key, reverse)
     n = len(arr)
     for i in range(n):
         for j in range(0, n - i - 1):
@@ -30,17 +88,234 @@ def bubble_sort(arr):
 
 
 
+def optimized_bubble_sort(arr, key=None, reverse=False):
+    # Bubble sort that remembers where the last swap of a pass happened:
+    # everything after it is already in place, so the next pass stops
+    # there, and a pass without swaps ends the sort (one pass if sorted).
+    if key is not None or reverse:
+        return sort_by_key(optimized_bubble_sort, arr, key, reverse)
+    end = len(arr) - 1
+    while end > 0:
+        last_swap = 0
+        for j in range(end):
+            if arr[j + 1] < arr[j]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                last_swap = j
+        end = last_swap
+    return arr
 
+def cocktail_shaker_sort(arr, key=None, reverse=False):
+    # Bubble passes in alternating directions, each bounded by the last swap
+    # of the pass before, so small values near the end ("turtles") move to
+    # the front in one backward pass instead of one step per pass.
+    if key is not None or reverse:
+        return sort_by_key(cocktail_shaker_sort, arr, key, reverse)
+    lo, hi = 0, len(arr) - 1
+    while lo < hi:
+        last_swap = lo
+        for j in range(lo, hi):
+            if arr[j + 1] < arr[j]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                last_swap = j
+        hi = last_swap
 
-def merge_sort(arr):
-    if len(arr) <= 1:
+        last_swap = hi
+        for j in range(hi, lo, -1):
+            if arr[j] < arr[j - 1]:
+                arr[j - 1], arr[j] = arr[j], arr[j - 1]
+                last_swap = j
+        lo = last_swap
+    return arr
+
+def binary_insertion_sort(arr, key=None, reverse=False):
+    # Insertion sort that finds each position with a binary search, so it
+    # makes O(n log n) comparisons; the shift is a single memmove (del +
+    # insert) instead of a Python loop. Elements already in order are
+    # skipped after one comparison. Stable: bisect_right inserts after
+    # equal elements.
+    if key is not None or reverse:
+        return sort_by_key(binary_insertion_sort, arr, key, reverse)
+    for i in range(1, len(arr)):
+        x = arr[i]
+        if not x < arr[i - 1]:
+            continue
+        pos = bisect_right(arr, x, 0, i - 1)
+        del arr[i]
+        arr.insert(pos, x)
+    return arr
+
+# Usage:
+# my_list = [64, 34, 25, 12, 22, 11, 90]
+# optimized_bubble_sort(my_list)
+# print(my_list)
+
+
+
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+COMB_SHRINK = 1.3
+
+
+def ciura_gaps(n):
+    # Ciura's empirically best gaps, continued by a factor of 2.25 past
+    # 1750; largest first, all below n.
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] * 2.25 < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in reversed(gaps) if gap < n]
+
+def tokuda_gaps(n):
+    # h_k = ceil((9^k - 4^k) / (5 * 4^(k-1))): 1, 4, 9, 20, 46, 103, ...
+    gaps = []
+    k = 1
+    while True:
+        gap = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+        if gap >= n:
+            return gaps[::-1]
+        gaps.append(gap)
+        k += 1
+
+def shell_sort(arr, key=None, reverse=False, gaps=ciura_gaps):
+    # Insertion sort over elements gap apart, for each gap of a shrinking
+    # sequence ending in 1. The early large-gap passes move elements far
+    # in one step, so the final insertion sort has little left to do.
+    # Not stable (except through key=).
+    if key is not None or reverse:
+        return sort_by_key(lambda a: shell_sort(a, gaps=gaps), arr, key, reverse)
+    n = len(arr)
+    for gap in gaps(n):
+        for i in range(gap, n):
+            x = arr[i]
+            j = i
+            while j >= gap and x < arr[j - gap]:
+                arr[j] = arr[j - gap]
+                j -= gap
+            arr[j] = x
+    return arr
+
+def shell_sort_tokuda(arr, key=None, reverse=False):
+    return shell_sort(arr, key, reverse, gaps=tokuda_gaps)
+
+def comb_sort(arr, key=None, reverse=False):
+    # Bubble sort with a gap that shrinks by COMB_SHRINK each pass (the
+    # "Combsort11" variant: gaps 9 and 10 become 11), finishing with gap 1
+    # passes until one makes no swap. Not stable (except through key=).
+    if key is not None or reverse:
+        return sort_by_key(comb_sort, arr, key, reverse)
+    n = len(arr)
+    gap = n
+    swapped = True
+    while gap > 1 or swapped:
+        gap = max(int(gap / COMB_SHRINK), 1)
+        if gap in (9, 10):
+            gap = 11
+        swapped = False
+        for i in range(n - gap):
+            if arr[i + gap] < arr[i]:
+                arr[i], arr[i + gap] = arr[i + gap], arr[i]
+                swapped = True
+    return arr
+
+# Usage:
+# my_list = [64, 34, 25, 12, 22, 11, 90]
+# shell_sort(my_list)                     # Ciura gaps
+# shell_sort(my_list, gaps=tokuda_gaps)
+# comb_sort(my_list)
+# print(my_list)
+
+
+
+
+
+MIN_RUN = 32
+
+
+def merge_sort(arr, key=None, reverse=False):
+    # Bottom-up natural merge sort. Existing runs are detected up front and
+    # then merged pairwise, ping-ponging between arr and one scratch buffer
+    # of size n. Sorts in place, is stable and returns arr.
+    if key is not None or reverse:
+        return sort_by_key(merge_sort, arr, key, reverse)
+    n = len(arr)
+    if n <= 1:
         return arr
 
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
+    runs = find_runs(arr, MIN_RUN)
+    src, dst = arr, scratch(arr, n)
+
+    while len(runs) > 2:
+        merged = [0]
+        for k in range(2, len(runs), 2):
+            merge_runs(src, dst, runs[k - 2], runs[k - 1], runs[k])
+            merged.append(runs[k])
+        if len(runs) % 2 == 0:
+            # Odd number of runs: the last one is carried over unchanged.
+            lo = runs[-2]
+            dst[lo:n] = src[lo:n]
+            merged.append(n)
+        runs = merged
+        src, dst = dst, src
+
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+def find_runs(arr, min_run):
+    # Returns run boundaries [0, b1, b2, ..., n]. Strictly descending runs are
+    # reversed in place (strictness keeps the sort stable) and runs shorter
+    # than min_run are extended with insertion sort.
+    n = len(arr)
+    runs = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n:
+            if arr[hi] < arr[lo]:
+                while hi + 1 < n and arr[hi + 1] < arr[hi]:
+                    hi += 1
+                arr[lo:hi + 1] = arr[lo:hi + 1][::-1]
+            else:
+                while hi + 1 < n and not arr[hi + 1] < arr[hi]:
+                    hi += 1
+            hi += 1
+
+        if hi - lo < min_run and hi < n:
+            hi = min(lo + min_run, n)
+            insertion_sort_range(arr, lo, hi - 1)
 
-    return merge(left, right)
+        runs.append(hi)
+        lo = hi
+    return runs
+
+def merge_runs(src, dst, lo, mid, hi):
+    # Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    if not src[mid] < src[mid - 1]:
+        # Already in order, e.g. two halves of a sorted stretch.
+        dst[lo:hi] = src[lo:hi]
+        return
+
+    # Gallop over the prefix of the left run that is <= the first right
+    # element, and the suffix of the right run that is >= the last left
+    # element; both are already in their final positions.
+    i = bisect_right(src, src[mid], lo, mid)
+    end = bisect_left(src, src[mid - 1], mid, hi)
+    dst[lo:i] = src[lo:i]
+    dst[end:hi] = src[end:hi]
+
+    j = mid
+    k = i
+    while i < mid and j < end:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+
+    if i < mid:
+        dst[k:end] = src[i:mid]
+    else:
+        dst[k:end] = src[j:end]
 
 def merge(left, right):
     result = []
@@ -58,47 +333,811 @@ def merge(left, right):
     result.extend(right[j:])
     return result
 
+def kway_merge(*iterables, key=None):
+    # Lazily merges any number of sorted iterables with a tournament (loser)
+    # tree: only the current head of each input is held, so memory is O(k),
+    # and each output costs one comparison per tree level, log2(k) in all.
+    # key is called once per element. Equal keys come out in input order,
+    # so merging the runs of a stable sort keeps it stable.
+    iterators = [iter(it) for it in iterables]
+    k = len(iterators)
+    if k == 0:
+        return
+    if k == 1 and key is None:
+        yield from iterators[0]
+        return
+
+    heads = [None] * k
+    keys = [None] * k
+    alive = [False] * k
+    for i, it in enumerate(iterators):
+        for value in it:
+            heads[i] = value
+            keys[i] = value if key is None else key(value)
+            alive[i] = True
+            break
+
+    def precedes(a, b):
+        # Exhausted inputs lose every match; ties go to the earlier input.
+        if not alive[b]:
+            return alive[a] or a < b
+        if not alive[a]:
+            return False
+        if keys[a] < keys[b]:
+            return True
+        return not keys[b] < keys[a] and a < b
+
+    # Leaves are k..2k-1; tree[node] keeps the loser of the match at node.
+    winners = [0] * k + list(range(k))
+    tree = [0] * k
+    for node in range(k - 1, 0, -1):
+        left, right = winners[2 * node], winners[2 * node + 1]
+        if precedes(left, right):
+            winners[node], tree[node] = left, right
+        else:
+            winners[node], tree[node] = right, left
+    winner = winners[1] if k > 1 else 0
+
+    while alive[winner]:
+        yield heads[winner]
+        for value in iterators[winner]:
+            heads[winner] = value
+            keys[winner] = value if key is None else key(value)
+            break
+        else:
+            alive[winner] = False
+            heads[winner] = keys[winner] = None
+
+        # Replay the matches from the winner's leaf up to the root
+        # (precedes() inlined, this is the hot loop).
+        node = (winner + k) // 2
+        while node:
+            other = tree[node]
+            if alive[other] and (not alive[winner] or keys[other] < keys[winner]
+                                 or (other < winner and not keys[winner] < keys[other])):
+                tree[node], winner = winner, other
+            node //= 2
+
 # Usage:
 # my_list = [38, 27, 43, 3, 9, 82, 10]
-# sorted_list = merge_sort(my_list)
-# print(sorted_list)
-
+# merge_sort(my_list)
+# print(my_list)
+# print(list(kway_merge([1, 4, 9], iter([2, 3]), (n * n for n in range(4)))))
 
 
 
+MIN_MERGE = 64
+MIN_GALLOP = 7
 
 
-def quick_sort(arr):
-    if len(arr) <= 1:
+def tim_sort(arr, key=None, reverse=False):
+    # Timsort. Natural runs (ascending, or strictly descending and then
+    # reversed) are found left to right; runs shorter than min_run are
+    # extended with binary insertion sort. Runs are pushed on a stack whose
+    # lengths are kept growing like Fibonacci numbers (see merge_collapse),
+    # so merges stay balanced and recently found runs are merged while they
+    # are still in cache. Merges switch to galloping when one run keeps
+    # winning. Sorts in place, is stable and returns arr.
+    if key is not None or reverse:
+        return sort_by_key(tim_sort, arr, key, reverse)
+    n = len(arr)
+    if n < 2:
         return arr
 
-    pivot = select_pivot(arr)
-    less, equal, greater = partition(arr, pivot)
+    min_run = compute_min_run(n)
+    runs = []  # stack of (start, length)
+    lo = 0
+    while lo < n:
+        length = count_run(arr, lo, n)
+        if length < min_run:
+            forced = min(min_run, n - lo)
+            extend_run(arr, lo, lo + length, lo + forced)
+            length = forced
+        runs.append((lo, length))
+        merge_collapse(arr, runs)
+        lo += length
+
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+            i -= 1
+        merge_at(arr, runs, i)
+    return arr
+
+def compute_min_run(n):
+    # A min_run in [32, 64] such that n / min_run is a power of two or a
+    # little less, so the final merges are close to perfectly balanced.
+    r = 0
+    while n >= MIN_MERGE:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def count_run(arr, lo, hi):
+    # Length of the natural run starting at lo. A strictly descending run
+    # is reversed in place (strictness keeps the sort stable).
+    end = lo + 1
+    if end == hi:
+        return 1
+    if arr[end] < arr[lo]:
+        while end + 1 < hi and arr[end + 1] < arr[end]:
+            end += 1
+        arr[lo:end + 1] = arr[lo:end + 1][::-1]
+    else:
+        while end + 1 < hi and not arr[end + 1] < arr[end]:
+            end += 1
+    return end + 1 - lo
+
+def extend_run(arr, lo, start, hi):
+    # Binary insertion sort of arr[start:hi] into the sorted arr[lo:start].
+    # The shift is a slice copy of at most min_run elements.
+    for i in range(start, hi):
+        x = arr[i]
+        if not x < arr[i - 1]:
+            continue
+        pos = bisect_right(arr, x, lo, i - 1)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = x
+
+def merge_collapse(arr, runs):
+    # Restore the stack invariants for the top runs A, B, C, D (D on top):
+    # len(B) > len(C) + len(D), len(A) > len(B) + len(C) and len(C) > len(D).
+    # Checking A as well as B is the 2015 fix; without it the invariant can
+    # break deeper in the stack.
+    while len(runs) > 1:
+        i = len(runs) - 2
+        if ((i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1])
+                or (i > 1 and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1])):
+            if runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+        elif runs[i][1] > runs[i + 1][1]:
+            break
+        merge_at(arr, runs, i)
+
+def merge_at(arr, runs, i):
+    # Merge the adjacent runs i and i + 1 of the stack in place.
+    lo, length1 = runs[i]
+    mid, length2 = runs[i + 1]
+    hi = mid + length2
+    runs[i] = (lo, length1 + length2)
+    del runs[i + 1]
+
+    # Elements of the left run <= the first right element, and elements of
+    # the right run >= the last left element, are already in place.
+    lo = gallop(bisect_right, arr[mid], arr, lo, mid)
+    if lo == mid:
+        return
+    hi = gallop(bisect_left, arr[mid - 1], arr, mid, hi, from_end=True)
+    if hi == mid:
+        return
+    if mid - lo <= hi - mid:
+        merge_lo(arr, lo, mid, hi)
+    else:
+        merge_hi(arr, lo, mid, hi)
+
+def gallop(find, x, arr, lo, hi, from_end=False):
+    # find(arr, x, lo, hi) for find = bisect_left or bisect_right, but the
+    # answer is first bracketed by probing 1, 2, 4, 8, ... places from lo
+    # (or back from hi), so an answer d places away costs O(log d)
+    # comparisons rather than O(log(hi - lo)).
+    step = 1
+    if from_end:
+        while hi - step >= lo:
+            probe = hi - step
+            if find(arr, x, probe, probe + 1) > probe:
+                return find(arr, x, probe + 1, hi)
+            hi = probe
+            step *= 2
+    else:
+        while lo + step - 1 < hi:
+            probe = lo + step - 1
+            if find(arr, x, probe, probe + 1) == probe:
+                return find(arr, x, lo, probe)
+            lo = probe + 1
+            step *= 2
+    return find(arr, x, lo, hi)
+
+def merge_lo(arr, lo, mid, hi):
+    # Merge arr[lo:mid] and arr[mid:hi] front to back; the left run is the
+    # shorter one and is the only one copied out. After min_gallop wins in a
+    # row by one side, whole blocks are found with gallop() and moved with
+    # slice copies; min_gallop adapts to how well galloping pays off.
+    left = copy_range(arr, lo, mid)
+    i, n1 = 0, len(left)
+    j, k = mid, lo
+    min_gallop = MIN_GALLOP
+    while i < n1 and j < hi:
+        wins_left = wins_right = 0
+        while i < n1 and j < hi:
+            if arr[j] < left[i]:
+                arr[k] = arr[j]
+                j += 1
+                wins_right += 1
+                wins_left = 0
+            else:
+                arr[k] = left[i]
+                i += 1
+                wins_left += 1
+                wins_right = 0
+            k += 1
+            if wins_left >= min_gallop or wins_right >= min_gallop:
+                break
+
+        while i < n1 and j < hi:
+            end = gallop(bisect_right, arr[j], left, i, n1)
+            wins_left = end - i
+            arr[k:k + wins_left] = left[i:end]
+            k += wins_left
+            i = end
+            if i == n1:
+                break
+            end = gallop(bisect_left, left[i], arr, j, hi)
+            wins_right = end - j
+            arr[k:k + wins_right] = arr[j:end]
+            k += wins_right
+            j = end
+            min_gallop = max(min_gallop - 1, 1)
+            if wins_left < MIN_GALLOP and wins_right < MIN_GALLOP:
+                min_gallop += 2
+                break
+
+    # Any rest of the right run is already in place
+    arr[k:k + n1 - i] = left[i:]
+
+def merge_hi(arr, lo, mid, hi):
+    # Mirror image of merge_lo for a shorter right run: it is copied out and
+    # the merge fills arr from hi downwards.
+    right = copy_range(arr, mid, hi)
+    i, j, k = mid - 1, len(right) - 1, hi - 1
+    min_gallop = MIN_GALLOP
+    while i >= lo and j >= 0:
+        wins_left = wins_right = 0
+        while i >= lo and j >= 0:
+            if right[j] < arr[i]:
+                arr[k] = arr[i]
+                i -= 1
+                wins_left += 1
+                wins_right = 0
+            else:
+                arr[k] = right[j]
+                j -= 1
+                wins_right += 1
+                wins_left = 0
+            k -= 1
+            if wins_left >= min_gallop or wins_right >= min_gallop:
+                break
+
+        while i >= lo and j >= 0:
+            start = gallop(bisect_right, right[j], arr, lo, i + 1, from_end=True)
+            wins_left = i + 1 - start
+            arr[k - wins_left + 1:k + 1] = arr[start:i + 1]
+            k -= wins_left
+            i = start - 1
+            if i < lo:
+                break
+            start = gallop(bisect_left, arr[i], right, 0, j + 1, from_end=True)
+            wins_right = j + 1 - start
+            arr[k - wins_right + 1:k + 1] = right[start:j + 1]
+            k -= wins_right
+            j = start - 1
+            min_gallop = max(min_gallop - 1, 1)
+            if wins_left < MIN_GALLOP and wins_right < MIN_GALLOP:
+                min_gallop += 2
+                break
+
+    # Any rest of the left run is already in place
+    arr[lo:lo + j + 1] = right[:j + 1]
+
+# Usage:
+# my_list = [38, 27, 43, 3, 9, 82, 10]
+# tim_sort(my_list)
+# print(my_list)
+
+
+
+
+
+
+INSERTION_SORT_THRESHOLD = 16
+
+
+def quick_sort(arr, key=None, reverse=False):
+    # In-place introsort: Hoare partitioning on index ranges, insertion sort
+    # for small ranges and heapsort once recursion gets deeper than 2*log2(n).
+    if key is not None or reverse:
+        return sort_by_key(quick_sort, arr, key, reverse)
+    n = len(arr)
+    if n > 1:
+        introsort(arr, 0, n - 1, 2 * n.bit_length())
+    return arr
+
+def introsort(arr, lo, hi, depth_limit):
+    while hi - lo > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            heap_sort_range(arr, lo, hi)
+            return
+        depth_limit -= 1
+
+        p = partition(arr, lo, hi)
+
+        # Recurse into the smaller side and loop on the larger one, so the
+        # stack never grows beyond O(log n) frames.
+        if p - lo < hi - p:
+            introsort(arr, lo, p, depth_limit)
+            lo = p + 1
+        else:
+            introsort(arr, p + 1, hi, depth_limit)
+            hi = p
+
+    insertion_sort_range(arr, lo, hi)
 
-    return quick_sort(less) + equal + quick_sort(greater)
+def select_pivot(arr, lo, hi):
+    # Median-of-three, or Tukey's ninther for large ranges. Returns an index.
+    mid = (lo + hi) // 2
+    if hi - lo > 128:
+        step = (hi - lo) // 8
+        return median_of_three(
+            arr,
+            median_of_three(arr, lo, lo + step, lo + 2 * step),
+            median_of_three(arr, mid - step, mid, mid + step),
+            median_of_three(arr, hi - 2 * step, hi - step, hi),
+        )
+    return median_of_three(arr, lo, mid, hi)
 
-def select_pivot(arr):
-    return arr[len(arr) // 2]
+def median_of_three(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
 
-def partition(arr, pivot):
-    less = []
-    equal = []
-    greater = []
+def partition(arr, lo, hi):
+    # Hoare partition of arr[lo..hi] around the selected pivot. Elements equal
+    # to the pivot stop both scans, so runs of duplicates split evenly.
+    # Returns p such that arr[lo..p] <= pivot <= arr[p+1..hi].
+    p = select_pivot(arr, lo, hi)
+    arr[lo], arr[p] = arr[p], arr[lo]
+    pivot = arr[lo]
 
-    for element in arr:
-        if element < pivot:
-            less.append(element)
-        elif element == pivot:
-            equal.append(element)
+    i = lo - 1
+    j = hi + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j
+        arr[i], arr[j] = arr[j], arr[i]
+
+def insertion_sort_range(arr, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= lo and value < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+def heap_sort_range(arr, lo, hi):
+    n = hi - lo + 1
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(arr, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        sift_down(arr, lo, 0, end)
+
+def sift_down(arr, offset, root, size):
+    # Max-heap sift on arr[offset:offset + size].
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and arr[offset + child] < arr[offset + child + 1]:
+            child += 1
+        if not arr[offset + root] < arr[offset + child]:
+            return
+        arr[offset + root], arr[offset + child] = arr[offset + child], arr[offset + root]
+        root = child
+
+# Usage:
+# my_list = [38, 27, 43, 3, 9, 82, 10]
+# quick_sort(my_list)
+# print(my_list)
+
+
+
+
+
+
+def argsort(arr, sort_fn=merge_sort, reverse=False):
+    # Returns the permutation p that sorts arr (arr[p[0]] <= arr[p[1]] <= ...)
+    # without moving arr. Each value is read once, as the key of its index;
+    # ties keep index order.
+    return sort_fn(list(range(len(arr))), key=arr.__getitem__, reverse=reverse)
+
+def merge_argsort(arr, reverse=False):
+    return argsort(arr, merge_sort, reverse)
+
+def quick_argsort(arr, reverse=False):
+    return argsort(arr, quick_sort, reverse)
+
+# Usage:
+# my_list = [38, 27, 43, 3, 9, 82, 10]
+# print(merge_argsort(my_list))  # [3, 4, 6, 1, 0, 2, 5]
+
+
+
+def partial_sort(arr, k):
+    # Rearranges arr in place so that arr[:k] holds the k smallest values in
+    # sorted order; the rest is left in no particular order. Quickselect
+    # with the introsort partition narrows down to the k-th position in
+    # O(n) expected time (heapsort if it degrades), then only arr[:k] is
+    # sorted: O(n + k log k) overall.
+    n = len(arr)
+    if k <= 0 or n <= 1:
+        return arr
+    if k >= n:
+        return quick_sort(arr)
+
+    lo, hi = 0, n - 1
+    depth_limit = 2 * n.bit_length()
+    while hi - lo > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            heap_sort_range(arr, lo, hi)
+            break
+        depth_limit -= 1
+        p = partition(arr, lo, hi)
+        if k - 1 <= p:
+            hi = p
         else:
-            greater.append(element)
+            lo = p + 1
+    else:
+        insertion_sort_range(arr, lo, hi)
+
+    introsort(arr, 0, k - 1, 2 * k.bit_length())
+    return arr
 
-    return less, equal, greater
+def nsmallest(arr, k, key=None):
+    # The k smallest values as a new sorted list, arr untouched. One pass
+    # keeps a bounded max-heap of the best k seen so far, so memory is O(k)
+    # and the input can be any iterable: O(n log k) worst case, close to
+    # O(n + k log k) on random input where few values beat the heap top.
+    if k <= 0:
+        return []
+    if key is not None:
+        # Stable: (key, index) pairs, values looked up at the end
+        values = list(arr)
+        pairs = nsmallest(((key(x), i) for i, x in enumerate(values)), k)
+        return [values[i] for _, i in pairs]
+
+    items = iter(arr)
+    heap = []
+    for x in items:
+        heap.append(x)
+        if len(heap) == k:
+            break
+    size = len(heap)
+    for start in range(size // 2 - 1, -1, -1):
+        sift_down(heap, 0, start, size)
+    for x in items:
+        if x < heap[0]:
+            heap[0] = x
+            sift_down(heap, 0, 0, size)
+
+    heap_sort_range(heap, 0, size - 1)
+    return heap
 
 # Usage:
 # my_list = [38, 27, 43, 3, 9, 82, 10]
-# sorted_list = quick_sort(my_list)
-# print(sorted_list)
+# partial_sort(my_list, 3)
+# print(my_list[:3])                 # [3, 9, 10]
+# print(nsmallest([5, 1, 4, 2], 2))  # [1, 2]
+
+
+
+
+
+
+def counting_sort(arr, key=None, reverse=False):
+    # Integers only. O(n + k) time and O(k) extra memory for a key range of k;
+    # negative values are handled by offsetting with the minimum.
+    if len(arr) <= 1:
+        return arr
+    if key is not None or reverse:
+        return counting_sort_by_key(arr, numeric_keys(arr, key, reverse))
+
+    lo = min(arr)
+    counts = [0] * (max(arr) - lo + 1)
+    for x in arr:
+        counts[x - lo] += 1
+
+    i = 0
+    for value, count in enumerate(counts, lo):
+        if count:
+            arr[i:i + count] = [value] * count
+            i += count
+    return arr
+
+def counting_sort_by_key(arr, keys):
+    # Stable counting sort of whole records: each record goes straight to
+    # the next free slot of its key, found from prefix sums of the counts.
+    values = list(arr)
+    lo = min(keys)
+    counts = [0] * (max(keys) - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+    starts = [0] * len(counts)
+    total = 0
+    for digit, count in enumerate(counts):
+        starts[digit] = total
+        total += count
+    for value, k in zip(values, keys):
+        arr[starts[k - lo]] = value
+        starts[k - lo] += 1
+    return arr
+
+# Usage:
+# my_list = [4, -2, 2, 8, 3, 3, 1]
+# counting_sort(my_list)
+# print(my_list)
+
+
+
+def radix_sort(arr, radix=256, key=None, reverse=False):
+    # LSD radix sort for integers, one stable distribution pass per base-radix
+    # digit. Keys are offset by the minimum so negative numbers work.
+    # Typed buffers (array.array, memoryview) are sorted through typed
+    # scratch arrays instead of lists.
+    if radix < 2:
+        raise ValueError("radix must be at least 2")
+    if len(arr) <= 1:
+        return arr
+    if key is not None or reverse:
+        return radix_sort_by_key(arr, numeric_keys(arr, key, reverse), radix)
+
+    lo = min(arr)
+    max_key = max(arr) - lo
+    if isinstance(arr, (array, memoryview)):
+        return radix_sort_array(arr, radix, lo, max_key)
+
+    keys = [x - lo for x in arr]
+    exp = 1
+    while exp <= max_key:
+        buckets = [[] for _ in range(radix)]
+        for key in keys:
+            buckets[key // exp % radix].append(key)
+        keys = [key for bucket in buckets for key in bucket]
+        exp *= radix
+
+    arr[:] = [key + lo for key in keys]
+    return arr
+
+def radix_sort_array(arr, radix, lo, max_key):
+    # Counting-sort passes that scatter between two 'q' arrays, so the keys
+    # never live in a list of boxed ints.
+    n = len(arr)
+    src = array("q", (x - lo for x in arr))
+    dst = array("q", bytes(src.itemsize * n))
+    exp = 1
+    while exp <= max_key:
+        counts = [0] * radix
+        for key in src:
+            counts[key // exp % radix] += 1
+        starts = [0] * radix
+        total = 0
+        for digit, count in enumerate(counts):
+            starts[digit] = total
+            total += count
+        for key in src:
+            digit = key // exp % radix
+            dst[starts[digit]] = key
+            starts[digit] += 1
+        src, dst = dst, src
+        exp *= radix
+
+    for i in range(n):
+        arr[i] = src[i] + lo
+    return arr
+
+def radix_sort_by_key(arr, keys, radix):
+    # The same stable digit passes, moving record indices instead of values.
+    values = list(arr)
+    lo = min(keys)
+    offsets = [k - lo for k in keys]
+    max_key = max(offsets)
+    order = list(range(len(values)))
+    exp = 1
+    while exp <= max_key:
+        buckets = [[] for _ in range(radix)]
+        for i in order:
+            buckets[offsets[i] // exp % radix].append(i)
+        order = [i for bucket in buckets for i in bucket]
+        exp *= radix
 
+    result = [values[i] for i in order]
+    arr[:] = array(arr.typecode, result) if isinstance(arr, array) else result
+    return arr
+
+# Usage:
+# my_list = [170, 45, -75, 90, -802, 24, 2, 66]
+# radix_sort(my_list)
+# print(my_list)
 
 
+
+def bucket_sort(arr, key=None, reverse=False):
+    # Bucket sort for floats (ints work too): n equal-width buckets between
+    # min and max, each sorted on its own and concatenated back into arr.
+    n = len(arr)
+    if n <= 1:
+        return arr
+    if key is not None or reverse:
+        return bucket_sort_by_key(arr, numeric_keys(arr, key, reverse))
+
+    lo = min(arr)
+    hi = max(arr)
+    if lo == hi:
+        return arr
+
+    width = bucket_width(lo, hi, n)
+    if width is None:
+        buckets = [list(arr)]
+    else:
+        buckets = [[] for _ in range(n)]
+        for x in arr:
+            buckets[min(int((x - lo) / width), n - 1)].append(x)
+
+    i = 0
+    for bucket in buckets:
+        size = len(bucket)
+        if size > INSERTION_SORT_THRESHOLD:
+            merge_sort(bucket)
+        elif size > 1:
+            insertion_sort_range(bucket, 0, size - 1)
+        arr[i:i + size] = bucket
+        i += size
+    return arr
+
+def bucket_width(lo, hi, n):
+    # Width of n equal buckets from lo to hi, or None if it is not a finite
+    # positive float: the span overflows (1e308 - -1e308 is inf, and a wide
+    # int range cannot even be converted), underflows to 0, or the input
+    # holds inf or NaN. The caller then sorts everything as one bucket,
+    # i.e. with merge_sort.
+    try:
+        width = (hi - lo) / n
+    except OverflowError:
+        return None
+    return width if 0 < width < float("inf") else None
+
+def bucket_sort_by_key(arr, keys):
+    # Buckets of (key, index) pairs; the index keeps each bucket's sort stable.
+    values = list(arr)
+    n = len(values)
+    lo = min(keys)
+    hi = max(keys)
+    if lo == hi:
+        return arr
+
+    width = bucket_width(lo, hi, n)
+    if width is None:
+        buckets = [[(k, i) for i, k in enumerate(keys)]]
+    else:
+        buckets = [[] for _ in range(n)]
+        for i, k in enumerate(keys):
+            buckets[min(int((k - lo) / width), n - 1)].append((k, i))
+
+    i = 0
+    for bucket in buckets:
+        if len(bucket) > 1:
+            merge_sort(bucket)
+        for _, index in bucket:
+            arr[i] = values[index]
+            i += 1
+    return arr
+
+# Usage:
+# my_list = [0.42, -1.5, 3.25, 0.0, 2.75]
+# bucket_sort(my_list)
+# print(my_list)
+
+
+
+
+
+def insertion_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(insertion_sort, arr, key, reverse)
+    insertion_sort_range(arr, 0, len(arr) - 1)
+    return arr
+
+# Usage:
+# my_list = [12, 11, 13, 5, 6]
+# insertion_sort(my_list)
+# print(my_list)
+
+
+
+TINY_INPUT = 32
+NEARLY_SORTED_DESCENTS = 8
+NEARLY_SORTED_MAX_N = 1024
+PROFILE_SAMPLE = 1024
+
+
+def adaptive_sort(arr, stable=False, key=None, reverse=False):
+    # Profiles the input, then hands it to the engine chosen by
+    # choose_algorithm(). The choice is kept in adaptive_sort.last_choice as
+    # (algorithm name, reason) so benchmarks can check the routing. With a
+    # key the (key, index) pairs are profiled and sorted instead.
+    if key is not None or reverse:
+        return sort_by_key(lambda pairs: adaptive_sort(pairs, stable), arr, key, reverse)
+    name, sort_fn, reason = choose_algorithm(arr, stable)
+    adaptive_sort.last_choice = (name, reason)
+    return sort_fn(arr)
+
+adaptive_sort.last_choice = None
+
+def choose_algorithm(arr, stable=False):
+    # Returns (algorithm name, sort function, reason).
+    profile = profile_input(arr)
+    n = profile["n"]
+    descents = profile["descents"]
+
+    if n <= TINY_INPUT:
+        return "Insertion Sort", insertion_sort, f"tiny input (n={n})"
+    if descents == 0:
+        return "Insertion Sort", insertion_sort, "already sorted, one linear pass"
+    if descents <= NEARLY_SORTED_DESCENTS and n <= NEARLY_SORTED_MAX_N:
+        return ("Insertion Sort", insertion_sort,
+                f"nearly sorted ({descents} descents, n={n})")
+    if descents + 1 <= n // MIN_RUN:
+        return ("Merge Sort", merge_sort,
+                f"presorted: {descents + 1} natural runs for n={n}")
+    if profile["integers"] and profile["key_range"] <= 4 * n:
+        return ("Counting Sort", counting_sort,
+                f"narrow key range ({profile['key_range']} values for n={n})")
+    if stable:
+        return "Merge Sort", merge_sort, "stable sort requested"
+    return ("Quick Sort", quick_sort,
+            f"general input ({profile['duplicate_ratio']:.0%} duplicates in sample)")
+
+def profile_input(arr):
+    # One pass for size, number of descents (runs - 1), key range and whether
+    # every value is an int; duplicate ratio comes from an evenly spaced sample.
+    n = len(arr)
+    profile = {"n": n, "descents": 0, "integers": False, "key_range": 0,
+               "duplicate_ratio": 0.0}
+    if n == 0:
+        return profile
+
+    lo = hi = prev = arr[0]
+    descents = 0
+    integers = True
+    for x in arr:
+        if x < prev:
+            descents += 1
+        if x < lo:
+            lo = x
+        elif hi < x:
+            hi = x
+        if integers and type(x) is not int:
+            integers = False
+        prev = x
+
+    step = max(n // PROFILE_SAMPLE, 1)
+    sample = arr[::step]
+    profile["descents"] = descents
+    profile["integers"] = integers
+    profile["key_range"] = hi - lo + 1 if integers else 0
+    profile["duplicate_ratio"] = 1 - len(set(sample)) / len(sample)
+    return profile
+
+# Usage:
+# my_list = [38, 27, 43, 3, 9, 82, 10]
+# adaptive_sort(my_list)
+# print(my_list, adaptive_sort.last_choice)
@@ -0,0 +1,81 @@
+"""
+Registry of the benchmarkable sorting algorithms shared by the CLI and GUI.
+
+NumPy is optional: its variants are only listed when numpy_backend can be
+imported, and the import is deferred until they are asked for.
+"""
+from algorithm_functions import (selection_sort, bubble_sort, optimized_bubble_sort,
+                                 cocktail_shaker_sort, binary_insertion_sort, shell_sort,
+                                 shell_sort_tokuda, comb_sort, merge_sort, tim_sort, quick_sort,
+                                 counting_sort, radix_sort, bucket_sort, adaptive_sort)
+from parallel_sort import parallel_merge_sort
+
+
+# (display name, complexity label, sort function)
+ALGORITHMS = [
+    ("Selection Sort", "O(n²)",      selection_sort),
+    ("Bubble Sort",    "O(n²)",      bubble_sort),
+    ("Bubble Sort (early exit)", "O(n²)", optimized_bubble_sort),
+    ("Cocktail Shaker Sort",  "O(n²)", cocktail_shaker_sort),
+    ("Binary Insertion Sort", "O(n²)", binary_insertion_sort),
+    ("Shell Sort (Ciura)",    "≈ O(n^1.3)", shell_sort),
+    ("Shell Sort (Tokuda)",   "≈ O(n^1.3)", shell_sort_tokuda),
+    ("Comb Sort",      "≈ O(n log n)", comb_sort),
+    ("Merge Sort",     "O(n log n)", merge_sort),
+    ("Tim Sort",       "O(n log n)", tim_sort),
+    ("Quick Sort",     "O(n log n)", quick_sort),
+    ("Parallel Merge Sort", "O(n log n)", parallel_merge_sort),
+    ("Counting Sort",  "O(n + k)",   counting_sort),
+    ("Radix Sort",     "O(d(n + b))", radix_sort),
+    ("Bucket Sort",    "O(n) avg",   bucket_sort),
+    ("Adaptive Sort",  "adaptive",   adaptive_sort),
+]
+
+# Sorts that keep equal elements in input order even without key= (with
+# key= every pure-Python sort is stable, see algorithm_functions.sort_by_key)
+STABLE_SORTS = {bubble_sort, optimized_bubble_sort, cocktail_shaker_sort,
+                binary_insertion_sort, merge_sort, tim_sort, parallel_merge_sort}
+
+NUMPY_SUFFIX = " (NumPy)"
+
+
+def numpy_algorithms():
+    """Return the NumPy variants of ALGORITHMS, or [] if NumPy is missing."""
+    try:
+        import numpy_backend
+    except ImportError:
+        return []
+    return [
+        (name + NUMPY_SUFFIX, complexity, getattr(numpy_backend, fn.__name__))
+        for name, complexity, fn in ALGORITHMS
+        if hasattr(numpy_backend, fn.__name__)
+    ]
+
+
+def find_algorithm(name):
+    """Look up a sort function by display name, NumPy variants included."""
+    for algo_name, _, sort_fn in ALGORITHMS:
+        if algo_name == name:
+            return sort_fn
+    if name.endswith(NUMPY_SUFFIX):
+        for algo_name, _, sort_fn in numpy_algorithms():
+            if algo_name == name:
+                return sort_fn
+    raise KeyError(f"Unknown algorithm {name!r}")
+
+
+def backend_of(sort_fn):
+    """Return "numpy" or "python" depending on where sort_fn is defined."""
+    return "numpy" if sort_fn.__module__ == "numpy_backend" else "python"
+
+
+def make_input(values, backend):
+    """
+    Build the input container a backend sorts: a list or an ndarray.
+    values may be a list or a buffer (ndarray, memmap, array, memoryview);
+    buffers are copied as a whole rather than element by element.
+    """
+    if backend == "numpy":
+        import numpy as np
+        return np.array(values)
+    return values.tolist() if hasattr(values, "tolist") else list(values)
@@ -1,42 +1,104 @@
-# Import the sorting functions from algorithm_functions.py
-from algorithm_functions \
-import selection_sort, bubble_sort, merge_sort, quick_sort
+# Import the algorithm table shared with the GUI
+from algorithm_registry import ALGORITHMS, NUMPY_SUFFIX, numpy_algorithms, backend_of, make_input
+
+from benchmark import measure, format_time
+from instrumented_functions import count_operations
+from memory_profile import PROFILE_TIMEOUT, profile_memory, format_bytes
+from data_generators import DISTRIBUTIONS
+from dataset_cache import generate
+from result_store import ResultStore
+from verification import verify
 
 import random
-import time
 
 numberOfValues = int(input("Enter the number of values to sort: "))
-randomNumbers = [random.randint(1, 10000) for _ in range(numberOfValues)]
+
+distributionNames = list(DISTRIBUTIONS)
+distributionMenu = "".join(f"\n{number}: {name}" for number, name in enumerate(distributionNames, start=1))
+distributionText = input(distributionMenu + "\nWhich input distribution (default 1): ").strip()
+distributionName = distributionNames[int(distributionText) - 1 if distributionText else 0]
+
+seedText = input("Random seed (leave blank for a new one): ").strip()
+seed = int(seedText) if seedText else random.randrange(2 ** 32)
+print(f"Generating {distributionName} data with seed {seed}")
+
+randomNumbers = generate(distributionName, numberOfValues, seed=seed, lo=1, hi=10000)
 ''' print("Original List:", randomNumbers) '''
 
-algorithmType = int(input("\n1: Selection Sort"
-                          "\n2: Bubble Sort"
-                          "\n3: Merge Sort"
-                          "\n4: Quick Sort"
-                          "\nWhat algorithm would you choose to sort: "))
+menu = "".join(f"\n{number}: {name}" for number, (name, _, _) in enumerate(ALGORITHMS, start=1))
+algorithmType = int(input(menu + "\nWhat algorithm would you choose to sort: "))
 
+numpyVariants = {name: sortFunction for name, _, sortFunction in numpy_algorithms()}
+backendType = 1
+if numpyVariants:
+    backendType = int(input("\n1: Pure Python"
+                            "\n2: NumPy"
+                            "\n3: Both (side by side)"
+                            "\nWhich backend would you like to use: "))
 
+repeatsText = input("\nHow many timed repeats (default 5): ").strip()
+repeats = int(repeatsText) if repeatsText else 5
 
-startTime = time.time()
+countOperations = input("Count operations too? (y/N): ").strip().lower() == "y"
+profileMemory = input("Profile memory too? Slow for O(n²) sorts (y/N): ").strip().lower() == "y"
 
-if algorithmType == 1:
-    print("\nSelection Sort selected!")
-    sortedNumbers = selection_sort(randomNumbers)  # Use selection_sort for Selection Sort
-elif algorithmType == 2:
-    print("\nBubble Sort selected!")
-    sortedNumbers = bubble_sort(randomNumbers)  # Use bubble_sort for Bubble Sort
-elif algorithmType == 3:
-    print("\nMerge Sort selected!")
-    sortedNumbers = merge_sort(randomNumbers)  # Use merge_sort for Merge Sort
-elif algorithmType == 4:
-    print("\nQuick Sort selected!")
-    sortedNumbers = quick_sort(randomNumbers)  # Use quick_sort for Quick Sort
-else:
-    print("\nInvalid algorithm type. Please enter 1, 2, 3, or 4.")
+if 1 <= algorithmType <= len(ALGORITHMS) and backendType in {1, 2, 3} and repeats > 0:
+    algorithmName, _, sortFunction = ALGORITHMS[algorithmType - 1]
+    print(f"\n{algorithmName} selected!")
 
-endTime = time.time()
+    runs = []
+    if backendType in {1, 3}:
+        runs.append(("Pure Python", algorithmName, sortFunction))
+    if backendType in {2, 3}:
+        if algorithmName + NUMPY_SUFFIX in numpyVariants:
+            runs.append(("NumPy", algorithmName + NUMPY_SUFFIX, numpyVariants[algorithmName + NUMPY_SUFFIX]))
+        else:
+            print(f"{algorithmName} has no NumPy variant.")
 
-if algorithmType in {1, 2, 3, 4}:
-    ''' print("Sorted List:", sortedNumbers) '''
-    timeTaken = endTime - startTime
-    print(f"Time taken to sort: {timeTaken:.6f} seconds")
\ No newline at end of file
+    # One warm-up run, then `repeats` timed runs per backend, each output verified
+    measurements = measure([(backendName, function, make_input(randomNumbers, backend_of(function)))
+                            for backendName, _, function in runs],
+                           repeats=repeats, warmup=1, verify=verify)
+
+    # Keep the numbers for later regression checks (python result_store.py compare)
+    store = ResultStore()
+    for (backendName, runName, function), result in zip(runs, measurements):
+        result.name = runName
+        if not result.invalid:
+            store.save(result, backend_of(function), numberOfValues, distributionName, seed)
+
+    for (backendName, runName, function), result in zip(runs, measurements):
+        if result.invalid:
+            print(f"{backendName:<12} INVALID: {result.invalid} (not saved)")
+        print(f"{backendName:<12} median time: {format_time(result.median)}"
+              f" | mean {format_time(result.mean)} ± {format_time(result.ci95)}"
+              f" (95% CI, {repeats} runs)")
+        print(f"{'':<12} min {format_time(result.minimum)} | stdev {format_time(result.stdev)}"
+              f" | p95 {format_time(result.p95)}")
+        if getattr(function, "last_choice", None):
+            chosenName, reason = function.last_choice
+            print(f"{'':<12} routed to {chosenName}: {reason}")
+
+        if countOperations:
+            counts = count_operations(function, make_input(randomNumbers, backend_of(function)))
+            if counts is None:
+                print(f"{'':<12} operation counts: not available for this backend")
+            else:
+                print(f"{'':<12} comparisons {counts.comparisons:,} | moves {counts.moves:,}"
+                      f" | allocations {counts.allocations:,} | max recursion depth {counts.max_depth}")
+
+        # Memory footprint, measured in a fresh subprocess on the same input
+        if profileMemory:
+            try:
+                memory = profile_memory(runName, distributionName, numberOfValues, seed,
+                                        lo=1, hi=10000, timeout=PROFILE_TIMEOUT)
+            except RuntimeError as error:
+                print(f"{'':<12} {str(error).splitlines()[0]}")
+                continue
+            print(f"{'':<12} peak memory {format_bytes(memory.traced_peak)}"
+                  f" ({memory.bytes_per_element:.1f} bytes per value)"
+                  f" | peak RSS growth {format_bytes(memory.peak_rss)}"
+                  f" | allocations {'–' if memory.allocations is None else f'{memory.allocations:,}'}")
+else:
+    print(f"\nInvalid choice. Please enter an algorithm between 1 and {len(ALGORITHMS)},"
+          " a backend between 1 and 3 and a positive number of repeats.")
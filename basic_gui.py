@@ -16,6 +16,17 @@ def create_button(text, command):
     button = tk.Button(window, text=text, command=command)
     button.pack()
 
+# Only the first values of a list are put on screen; a Label holding a
+# million numbers takes Tk seconds to lay out
+PREVIEW_LENGTH = 50
+
+# Create a function to show the start of a long list
+def preview(values):
+    shown = ', '.join(map(str, values[:PREVIEW_LENGTH]))
+    if len(values) > PREVIEW_LENGTH:
+        shown += f", … ({len(values) - PREVIEW_LENGTH:,} more)"
+    return shown
+
 # Create the GUI window
 window = tk.Tk()
 window.title("Sorting Algorithm Selector")
@@ -25,7 +36,8 @@ def sort_list():
     selected_algorithm = algorithm_var.get()
     num_of_numbers = int(num_of_numbers_var.get())
 
-    unsorted_list = sample(range(1, 101), num_of_numbers)  # Generate random unsorted numbers
+    # Generate random unsorted numbers (distinct, so the range grows with the count)
+    unsorted_list = sample(range(1, max(num_of_numbers, 100) + 1), num_of_numbers)
 
     sorting_functions = {
         "Selection Sort": selection_sort,
@@ -35,11 +47,12 @@ def sort_list():
     }
 
     if selected_algorithm in sorting_functions:
-        sorted_list = sorting_functions[selected_algorithm](unsorted_list)
-        result_label.config(text=f"Sorted List: {sorted_list}")
+        # Sort a copy: some sorts work in place and the unsorted list is shown too
+        sorted_list = sorting_functions[selected_algorithm](list(unsorted_list))
+        result_label.config(text=f"Sorted List: {preview(sorted_list)}")
 
         # Display the generated unsorted numbers
-        unsorted_label.config(text=f"Unsorted Numbers: {', '.join(map(str, unsorted_list))}")
+        unsorted_label.config(text=f"Unsorted Numbers: {preview(unsorted_list)}")
     else:
         messagebox.showerror("Error", "Please select a sorting algorithm.")
 
@@ -60,11 +73,11 @@ algorithm_dropdown.pack()
 create_button("Sort", sort_list)
 
 # Label to display the sorted list
-result_label = tk.Label(window, text="")
+result_label = tk.Label(window, text="", wraplength=600)
 result_label.pack()
 
 # Label to display the unsorted numbers
-unsorted_label = tk.Label(window, text="")
+unsorted_label = tk.Label(window, text="", wraplength=600)
 unsorted_label.pack()
 
 window.mainloop()
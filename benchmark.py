@@ -0,0 +1,189 @@
+"""
+Repeatable timing for the sorting benchmarks.
+
+Every algorithm gets warm-up runs that are discarded, then `repeats` timed
+runs, each on a fresh copy of the same input. Runs are interleaved in rounds
+and the algorithm order is shuffled every round, so slow drift (thermal
+throttling, background load) is spread across all algorithms instead of
+penalising whichever runs last. The garbage collector is disabled inside the
+timed region and a full collection is done before it. An optional verify
+callback checks every run's output after the clock has stopped.
+"""
+import copy
+import gc
+import math
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Measurement:
+    """Timings (in seconds) of one algorithm on one input."""
+    name: str
+    times: list[float] = field(default_factory=list)
+    counts: object = None   # OperationCounts from an instrumented run, if any
+    memory: object = None   # MemoryProfile from an isolated subprocess, if any
+    invalid: str = ""       # why an output failed verification, if one did
+
+    @property
+    def minimum(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.times)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.times, 95)
+
+    @property
+    def ci95(self) -> float:
+        """Half-width of the 95% confidence interval of the mean."""
+        n = len(self.times)
+        if n < 2:
+            return 0.0
+        return t_critical(0.95, n - 1) * self.stdev / math.sqrt(n)
+
+
+def measure(entries, repeats=5, warmup=1, seed=None, progress=None, verify=None):
+    """
+    Time each algorithm `repeats` times after `warmup` discarded runs.
+
+    Parameters
+    ----------
+    entries  : list of (name, sort_fn, data); data is copied before every run
+    seed     : seeds the per-round shuffling of the algorithm order
+    progress : optional callback(name, round_index, total_rounds)
+    verify   : optional callback(data, output) returning None or the reason
+               the output is wrong, which is kept in Measurement.invalid;
+               it runs outside the timed region
+
+    Returns a list of Measurement in the same order as entries.
+    """
+    rng = random.Random(seed)
+    results = {name: Measurement(name) for name, _, _ in entries}
+    order = list(entries)
+    rounds = warmup + repeats
+
+    for round_index in range(rounds):
+        rng.shuffle(order)
+        for name, sort_fn, data in order:
+            if progress:
+                progress(name, round_index, rounds)
+            elapsed, output = run_once(sort_fn, data)
+            if verify and not results[name].invalid:
+                results[name].invalid = verify(data, output) or ""
+            if round_index >= warmup:
+                results[name].times.append(elapsed)
+
+    return [results[name] for name, _, _ in entries]
+
+
+def time_once(sort_fn, data):
+    """Sort a copy of data once and return the elapsed seconds."""
+    return run_once(sort_fn, data)[0]
+
+
+def run_once(sort_fn, data):
+    """Sort a copy of data once; return (elapsed seconds, sorted output)."""
+    sample = copy.copy(data)
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        output = sort_fn(sample)
+        elapsed = time.perf_counter() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed, sample if output is None else output
+
+
+# ──────────────────────────────────────────────
+# Statistics helpers
+# ──────────────────────────────────────────────
+def percentile(values, pct):
+    """Linear-interpolated percentile of values (0 <= pct <= 100)."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def t_cdf(t, df):
+    """Cumulative distribution function of Student's t distribution."""
+    tail = 0.5 * incomplete_beta(df / 2, 0.5, df / (df + t * t))
+    return 1 - tail if t > 0 else tail
+
+
+def t_critical(confidence, df):
+    """Two-sided critical value of Student's t, found by bisection."""
+    target = 1 - (1 - confidence) / 2
+    lo, hi = 0.0, 1000.0
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if t_cdf(mid, df) < target:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def incomplete_beta(a, b, x):
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1 - x))
+    # The continued fraction converges fastest below the mean of the
+    # distribution; use the symmetry I_x(a, b) = 1 - I_(1-x)(b, a) above it.
+    if x < (a + 1) / (a + b + 2):
+        return front * beta_continued_fraction(a, b, x) / a
+    return 1 - front * beta_continued_fraction(b, a, 1 - x) / b
+
+
+def beta_continued_fraction(a, b, x, max_iterations=200, eps=1e-15):
+    """Lentz's method for the continued fraction of I_x(a, b)."""
+    tiny = 1e-300
+    c = 1.0
+    d = 1 - (a + b) * x / (a + 1)
+    d = 1 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, max_iterations + 1):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 + numerator * d
+            d = 1 / (d if abs(d) > tiny else tiny)
+            c = 1 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1) < eps:
+            break
+    return result
+
+
+def format_time(seconds: float) -> str:
+    """Return a human‑friendly string for a duration."""
+    if seconds < 0.001:
+        return f"{seconds * 1_000_000:.1f} µs"
+    elif seconds < 1.0:
+        return f"{seconds * 1_000:.2f} ms"
+    else:
+        return f"{seconds:.4f} s"
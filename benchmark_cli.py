@@ -0,0 +1,217 @@
+"""
+Headless, scriptable benchmark runner.
+
+Benchmarks every combination of the requested algorithms, sizes,
+distributions and seeds with benchmark.measure(), verifies the output of
+every run (verification.py: sorted, a permutation of the input and, for
+records, stable) and streams one record per (algorithm, backend, size,
+distribution, seed) as JSON lines or CSV to stdout or a file; a failed
+verification sets "correct" to false and gives the reason in "invalid".
+With --db the valid measurements are also saved to the result store
+(result_store.py) for regression checks. The exit status is 1 if any
+algorithm produced wrongly sorted output.
+
+--workload records sorts (value, index) tuples with key=itemgetter(0)
+instead of bare ints, to measure the cost of key extraction and of moving
+records; its correctness check also catches unstable results.
+--workload typed sorts an array('q') in place through a memoryview
+(typed_sort.py) with the algorithms that support it, for comparison with
+boxed ints in a list.
+
+Neither tkinter nor the NumPy backend is imported unless --backend asks for
+NumPy (data_generators still uses NumPy to build the inputs when it is
+installed, so seeds give the same data as in the GUI).
+
+Usage:
+    python benchmark_cli.py -a merge_sort "Quick Sort" -n 1000 100000 -d uniform sorted
+    python benchmark_cli.py -n 10000 -s 1 2 3 --backend both --format csv -o results.csv
+    python benchmark_cli.py -n 100000 --db && python result_store.py compare
+    python benchmark_cli.py -a merge_sort counting_sort -n 100000 --workload values records
+    python benchmark_cli.py -a quick_sort radix_sort -n 100000 --workload values typed
+    python benchmark_cli.py --list
+"""
+import argparse
+import csv
+import json
+import sys
+from functools import partial
+from operator import itemgetter
+
+from algorithm_registry import ALGORITHMS, NUMPY_SUFFIX, numpy_algorithms, backend_of, make_input
+from benchmark import measure
+from data_generators import DISTRIBUTIONS
+from dataset_cache import generate_array, generate_buffer
+from result_store import DEFAULT_DB, ResultStore
+from typed_sort import BUFFER_SORTS, sort_buffer
+from verification import verify
+
+
+RECORDS_SUFFIX = " (records)"
+TYPED_SUFFIX = " (typed)"
+FIELDS = ["algorithm", "backend", "workload", "n", "distribution", "seed", "repeats",
+          "median", "mean", "ci95", "min", "stdev", "p95", "correct", "invalid"]
+
+
+def resolve_algorithms(names):
+    """Map display names or function names (any case) to registry entries."""
+    lookup = {}
+    for name, _, sort_fn in ALGORITHMS:
+        lookup[name.lower()] = name
+        lookup[sort_fn.__name__] = name
+    resolved = []
+    for name in names:
+        key = name.lower()
+        if key not in lookup:
+            raise ValueError(f"Unknown algorithm {name!r}; see --list")
+        resolved.append(lookup[key])
+    return resolved
+
+
+def select_functions(names, backend):
+    """Return (name, sort_fn) pairs for the chosen backend(s)."""
+    selected = []
+    table = {name: sort_fn for name, _, sort_fn in ALGORITHMS}
+    variants = dict((name, fn) for name, _, fn in numpy_algorithms()) if backend != "python" else {}
+    for name in names:
+        if backend in ("python", "both"):
+            selected.append((name, table[name]))
+        if backend in ("numpy", "both"):
+            if name + NUMPY_SUFFIX in variants:
+                selected.append((name + NUMPY_SUFFIX, variants[name + NUMPY_SUFFIX]))
+            else:
+                print(f"warning: {name} has no NumPy variant (or NumPy is not installed)",
+                      file=sys.stderr)
+    return selected
+
+
+def as_records(values):
+    """(value, index) tuples: records sorted by their first field."""
+    return [(value, i) for i, value in enumerate(values)]
+
+
+def run(selected, sizes, distributions, seeds, repeats, warmup, write, store=None,
+        workload="values"):
+    """
+    Benchmark every combination, calling write(record) as each finishes and
+    saving the measurements to store (a ResultStore) if given.
+    """
+    all_correct = True
+    for distribution in distributions:
+        for n in sizes:
+            for seed in seeds:
+                print(f"{distribution}, n = {n:,}, seed {seed}, {workload}", file=sys.stderr)
+                values = generate_array(distribution, n, seed=seed)
+                inputs = {}
+                entries = []
+                check = verify
+                if workload == "records":
+                    inputs["python"] = as_records(values.tolist())
+                    check = partial(verify, key=itemgetter(0), stable=True)
+                elif workload == "typed":
+                    inputs["python"] = generate_buffer(distribution, n, seed=seed)
+                for name, sort_fn in selected:
+                    backend = backend_of(sort_fn)
+                    if workload == "records":
+                        if backend != "python":
+                            continue
+                        name, sort_fn = name + RECORDS_SUFFIX, partial(sort_fn, key=itemgetter(0))
+                    elif workload == "typed":
+                        if sort_fn not in BUFFER_SORTS:
+                            continue
+                        name, sort_fn = name + TYPED_SUFFIX, partial(sort_buffer, sort_fn=sort_fn)
+                    if backend not in inputs:
+                        inputs[backend] = make_input(values, backend)
+                    entries.append((name, sort_fn, inputs[backend]))
+
+                results = measure(entries, repeats=repeats, warmup=warmup, seed=seed,
+                                  verify=check)
+                for (name, sort_fn, data), result in zip(entries, results):
+                    correct = not result.invalid
+                    all_correct = all_correct and correct
+                    backend = backend_of(getattr(sort_fn, "func", sort_fn))
+                    if store and correct:
+                        store.save(result, backend, n, distribution, seed)
+                    write({
+                        "algorithm": name, "backend": backend, "workload": workload, "n": n,
+                        "distribution": distribution, "seed": seed, "repeats": repeats,
+                        "median": result.median, "mean": result.mean, "ci95": result.ci95,
+                        "min": result.minimum, "stdev": result.stdev, "p95": result.p95,
+                        "correct": correct, "invalid": result.invalid, "times": result.times,
+                    })
+    return all_correct
+
+
+def record_writer(out, fmt):
+    """Return write(record) streaming to out as JSON lines or CSV."""
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+
+        def write(record):
+            writer.writerow(record)
+            out.flush()
+    else:
+        def write(record):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+    return write
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark sorting algorithms without the GUI.")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=None,
+                        help="display or function names (default: all), e.g. merge_sort \"Quick Sort\"")
+    parser.add_argument("-n", "--sizes", nargs="+", type=int, default=[1000],
+                        help="input sizes (default 1000)")
+    parser.add_argument("-d", "--distributions", nargs="+", choices=list(DISTRIBUTIONS),
+                        default=["uniform"], metavar="DIST",
+                        help=f"input distributions (default uniform): {', '.join(DISTRIBUTIONS)}")
+    parser.add_argument("-s", "--seeds", nargs="+", type=int, default=[0],
+                        help="seeds for the generated inputs (default 0)")
+    parser.add_argument("-r", "--repeats", type=int, default=5, help="timed runs (default 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded runs (default 1)")
+    parser.add_argument("-w", "--workload", nargs="+", choices=("values", "records", "typed"),
+                        default=["values"],
+                        help="bare ints, (value, index) records sorted with key= and/or an "
+                             "array('q') sorted through a memoryview (python only)")
+    parser.add_argument("-b", "--backend", choices=("python", "numpy", "both"), default="python")
+    parser.add_argument("-f", "--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("-o", "--output", default=None, help="file to write (default stdout)")
+    parser.add_argument("--db", nargs="?", const=DEFAULT_DB, default=None,
+                        help="also save the results to this SQLite store (default file if no path)")
+    parser.add_argument("--list", action="store_true", help="list the algorithms and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, complexity, sort_fn in ALGORITHMS:
+            print(f"{name:<20} {sort_fn.__name__:<20} {complexity}")
+        return 0
+    if args.repeats <= 0 or args.warmup < 0 or any(n < 0 for n in args.sizes):
+        parser.error("repeats must be positive; warmup and sizes non-negative")
+    try:
+        names = resolve_algorithms(args.algorithms or [name for name, _, _ in ALGORITHMS])
+    except ValueError as error:
+        parser.error(str(error))
+
+    selected = select_functions(names, args.backend)
+    if not selected:
+        parser.error("nothing to run for this backend")
+
+    store = ResultStore(args.db) if args.db else None
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        write = record_writer(out, args.format)
+        all_correct = all([run(selected, args.sizes, args.distributions, args.seeds,
+                               args.repeats, args.warmup, write, store, workload)
+                           for workload in args.workload])
+    finally:
+        if args.output:
+            out.close()
+
+    if not all_correct:
+        print("error: some algorithms returned incorrectly sorted output", file=sys.stderr)
+    return 0 if all_correct else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Head-to-head timings of related functions, as named presets.
+
+Each preset is a fixed group of functions, some of them outside the
+algorithm registry (built-ins, heapq, merges, top-k selection), timed on
+the same input with benchmark.measure(). The median times are printed with
+each function's speed-up over the preset's baseline:
+
+    quadratic  the tuned quadratic and gap sorts against bubble_sort; nearly
+               sorted input, where early exit and last-swap tracking pay off
+    timsort    tim_sort (run stack, galloping merges) against merge_sort
+               (pairwise merges of natural runs) and CPython's sorted()
+    merge      merging k sorted runs with kway_merge, pairwise merge() calls
+               and heapq.merge, and a chunked sort ending in kway_merge,
+               against a plain merge_sort
+    top_k      partial_sort and nsmallest against quick_sort and slicing
+    argsort    merge_argsort and quick_argsort against sorted() over indices
+
+For registered algorithms across sizes, distributions, seeds and backends,
+with machine-readable output, use benchmark_cli.py instead.
+
+Usage:
+    python benchmark_presets.py quadratic                       # preset's default sizes
+    python benchmark_presets.py timsort 200000 --distributions sawtooth uniform
+    python benchmark_presets.py merge 1000000 --k 2 16 256
+    python benchmark_presets.py top_k 1000000 --k 10 1000 100000
+"""
+import argparse
+import heapq
+from dataclasses import dataclass
+
+from algorithm_functions import (selection_sort, bubble_sort, optimized_bubble_sort,
+                                 cocktail_shaker_sort, binary_insertion_sort, shell_sort,
+                                 shell_sort_tokuda, comb_sort, merge_sort, tim_sort, quick_sort,
+                                 kway_merge, merge, partial_sort, nsmallest, merge_argsort,
+                                 quick_argsort)
+from benchmark import format_time, measure
+from dataset_cache import generate
+
+
+def pairwise_merge(runs):
+    """Merge runs two at a time, round after round, with merge()."""
+    runs = list(runs)
+    if not runs:
+        return []
+    while len(runs) > 1:
+        runs = [merge(runs[i], runs[i + 1]) if i + 1 < len(runs) else runs[i]
+                for i in range(0, len(runs), 2)]
+    return runs[0]
+
+
+def chunked_sort(values, k):
+    """merge_sort k chunks independently, then stream them through kway_merge."""
+    size = -(-len(values) // k)
+    chunks = [merge_sort(values[i:i + size]) for i in range(0, len(values), size)]
+    return list(kway_merge(*chunks))
+
+
+def quadratic_entries(data, k=None):
+    return [
+        ("selection_sort",        selection_sort,        data),
+        ("bubble_sort",           bubble_sort,           data),
+        ("optimized_bubble_sort", optimized_bubble_sort, data),
+        ("cocktail_shaker_sort",  cocktail_shaker_sort,  data),
+        ("binary_insertion_sort", binary_insertion_sort, data),
+        ("shell_sort (Ciura)",    shell_sort,            data),
+        ("shell_sort (Tokuda)",   shell_sort_tokuda,     data),
+        ("comb_sort",             comb_sort,             data),
+    ]
+
+
+def timsort_entries(data, k=None):
+    return [
+        ("tim_sort",   tim_sort,   data),
+        ("merge_sort", merge_sort, data),
+        ("sorted",     sorted,     data),
+    ]
+
+
+def merge_entries(data, k):
+    size = -(-len(data) // k)
+    runs = [sorted(data[i:i + size]) for i in range(0, len(data), size)]
+    return [
+        ("kway_merge",       lambda r: list(kway_merge(*r)),   runs),
+        ("pairwise merge()", pairwise_merge,                    runs),
+        ("heapq.merge",      lambda r: list(heapq.merge(*r)),  runs),
+        ("chunked sort",     lambda v: chunked_sort(v, k),      data),
+        ("merge_sort",       merge_sort,                        data),
+    ]
+
+
+def top_k_entries(data, k):
+    return [
+        ("quick_sort + slice",  lambda a: quick_sort(a)[:k],     data),
+        ("partial_sort",        lambda a: partial_sort(a, k),    data),
+        ("nsmallest",           lambda a: nsmallest(a, k),       data),
+        ("heapq.nsmallest",     lambda a: heapq.nsmallest(k, a), data),
+    ]
+
+
+def argsort_entries(data, k=None):
+    return [
+        ("merge_argsort",       merge_argsort,                                      data),
+        ("quick_argsort",       quick_argsort,                                      data),
+        ("sorted(range, key)",  lambda a: sorted(range(len(a)), key=a.__getitem__), data),
+    ]
+
+
+@dataclass
+class Preset:
+    """A group of functions to time together and how to run it by default."""
+    entries: object            # entries(data, k) -> [(name, fn, data), ...]
+    baseline: str              # name of the entry the others are compared with
+    sizes: list
+    distributions: list
+    ks: list = None            # values of k to run per input, or None
+
+
+PRESETS = {
+    "quadratic": Preset(quadratic_entries, "bubble_sort", [1_000, 5_000], ["nearly_sorted"]),
+    "timsort":   Preset(timsort_entries, "merge_sort", [100_000, 1_000_000],
+                        ["nearly_sorted", "sawtooth"]),
+    "merge":     Preset(merge_entries, "merge_sort", [1_000_000], ["uniform"], [2, 8, 64, 512]),
+    "top_k":     Preset(top_k_entries, "quick_sort + slice", [100_000, 1_000_000], ["uniform"],
+                        [10, 1000]),
+    "argsort":   Preset(argsort_entries, "sorted(range, key)", [100_000, 1_000_000], ["uniform"]),
+}
+
+
+def report(preset, sizes=None, distributions=None, ks=None, repeats=3):
+    """Print each entry's median time and its speed-up over the baseline."""
+    for distribution in distributions or preset.distributions:
+        for n in sizes or preset.sizes:
+            data = generate(distribution, n, seed=0)
+            print(f"\nn = {n:,} ({distribution})")
+            for k in ks or preset.ks or [None]:
+                if k is not None and k > n:
+                    continue
+                results = measure(preset.entries(data, k), repeats=repeats, warmup=1)
+                baseline = next(r.median for r in results if r.name == preset.baseline)
+                indent = "  " if k is None else "    "
+                if k is not None:
+                    print(f"  k = {k:,}")
+                for result in results:
+                    print(f"{indent}{result.name:<22} {format_time(result.median):>10}"
+                          f"  {baseline / result.median:>8.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time a named group of related functions.")
+    parser.add_argument("preset", choices=list(PRESETS))
+    parser.add_argument("sizes", nargs="*", type=int, help="input sizes (default: the preset's)")
+    parser.add_argument("--distributions", nargs="+", default=None)
+    parser.add_argument("--k", nargs="+", type=int, default=None,
+                        help="runs to merge (merge) or values to select (top_k)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    report(PRESETS[args.preset], args.sizes, args.distributions, args.k, args.repeats)
@@ -0,0 +1,190 @@
+"""
+Empirical complexity sweeps.
+
+ParallelSweep times each algorithm over a geometric series of input sizes,
+stopping early once a size takes longer than the time budget (or, by
+next_size(), is predicted to), so O(n²) sorts cap themselves while
+O(n log n) sorts reach large n. It sweeps several algorithms at once, one
+job per (algorithm, size, repetition), on the worker processes of a
+JobRunner, so the total time shrinks with the number of cores. The GUI and
+the command line use it. fit_models() then fits the timings to the
+candidate models n, n log n and n² by least squares and reports the
+empirical exponent of t ~ c·n^k.
+
+Usage:
+    python complexity.py                      # every registered algorithm
+    python complexity.py "Merge Sort" "Bubble Sort"
+"""
+import math
+import sys
+from dataclasses import dataclass, field
+
+from algorithm_registry import ALGORITHMS
+from job_runner import Job, JobRunner
+
+
+DEFAULT_SIZES = [2 ** k for k in range(8, 25)]
+SWEEP_TIME_BUDGET = 1.0  # seconds per single run before the sweep stops
+
+MODELS = {
+    "O(n)":       lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)":      lambda n: n * n,
+}
+
+
+@dataclass
+class SweepResult:
+    """Timings of one algorithm across sizes, plus the fitted models."""
+    name: str
+    sizes: list[int] = field(default_factory=list)
+    times: list[float] = field(default_factory=list)
+    exponent: float = float("nan")
+    best_model: str = ""
+    constant: float = float("nan")       # c in t ≈ c·f(n) for the best model
+    model_errors: dict = field(default_factory=dict)
+
+
+def next_size(result, sizes=DEFAULT_SIZES, time_budget=SWEEP_TIME_BUDGET):
+    """The size to time after the last one in result, or None to stop."""
+    if not result.sizes:
+        return sizes[0] if sizes else None
+    n, elapsed = result.sizes[-1], result.times[-1]
+    if elapsed > time_budget or n == sizes[-1]:
+        return None
+    next_n = sizes[sizes.index(n) + 1]
+    # Stop before a size that the local growth rate says will blow
+    # the budget, e.g. quadrupling O(n²) times near the limit.
+    if len(result.times) >= 2:
+        growth = local_exponent(result.sizes[-2:], result.times[-2:])
+        if elapsed * (next_n / n) ** max(growth, 1.0) > time_budget:
+            return None
+    return next_n
+
+
+class ParallelSweep:
+    """
+    Sweeps several algorithms at once on a job_runner.JobRunner. Each
+    (algorithm, size, repetition) is one job; an algorithm's next size is
+    submitted as soon as all repetitions of its current size are in, so the
+    algorithms proceed independently and keep every worker busy. A timed-out
+    size ends that algorithm's sweep.
+
+    Feed every JobResult from runner.results to handle() until done is True.
+    """
+
+    def __init__(self, names, sizes=DEFAULT_SIZES, time_budget=SWEEP_TIME_BUDGET,
+                 distribution="uniform", seed=0, repeats=3, timeout=None):
+        self.sizes = sizes
+        self.time_budget = time_budget
+        self.distribution = distribution
+        self.seed = seed
+        self.repeats = repeats
+        self.timeout = timeout or 10 * time_budget
+        self.results = [SweepResult(name) for name in names]
+        self._by_name = {r.name: r for r in self.results}
+        self._pending = {}   # name -> JobResults of the size in flight
+        self.outstanding = 0
+
+    @property
+    def done(self):
+        return self.outstanding == 0
+
+    def start(self, runner):
+        for result in self.results:
+            self._submit(runner, result)
+
+    def handle(self, job_result, runner):
+        """Record one finished job and submit follow-up work."""
+        self.outstanding -= 1
+        job = job_result.job
+        result = self._by_name[job.name]
+        finished = self._pending[job.name]
+        finished.append(job_result)
+        if len(finished) < self.repeats:
+            return
+        del self._pending[job.name]
+
+        # A timeout in any repetition ends the sweep, whichever came last
+        times = [r.elapsed for r in finished if r.status == "ok"]
+        if not times or any(r.status == "timeout" for r in finished):
+            fit_models(result)
+            return
+        result.sizes.append(job.n)
+        result.times.append(min(times))
+        if not runner.cancelled:
+            self._submit(runner, result)
+
+    def _submit(self, runner, result):
+        n = next_size(result, self.sizes, self.time_budget)
+        if n is None:
+            fit_models(result)
+            return
+        self._pending[result.name] = []
+        for repetition in range(self.repeats):
+            runner.submit(Job(result.name, n, self.distribution, self.seed, repetition,
+                              timeout=self.timeout, warmup=False))
+            self.outstanding += 1
+
+
+def fit_models(result):
+    """Fill in exponent, best_model, constant and model_errors of result."""
+    sizes = [n for n, t in zip(result.sizes, result.times) if n > 1 and t > 0]
+    times = [t for n, t in zip(result.sizes, result.times) if n > 1 and t > 0]
+    if len(sizes) < 2:
+        return result
+
+    result.exponent = local_exponent(sizes, times)
+    constants = {}
+    for model, f in MODELS.items():
+        # Least squares for t = c·f(n), weighted by 1/t so that the small
+        # sizes count as much as the large ones; the error is the RMS
+        # relative deviation.
+        xs = [f(n) / t for n, t in zip(sizes, times)]
+        c = sum(xs) / sum(x * x for x in xs)
+        constants[model] = c
+        result.model_errors[model] = math.sqrt(
+            sum((c * x - 1) ** 2 for x in xs) / len(xs))
+    result.best_model = min(result.model_errors, key=result.model_errors.get)
+    result.constant = constants[result.best_model]
+    return result
+
+
+def local_exponent(sizes, times):
+    """Slope k of the least-squares line log t = k·log n + b."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in times]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    var = sum((x - x_mean) ** 2 for x in xs)
+    if var == 0:
+        return float("nan")
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / var
+
+
+def main(names):
+    table = {name: (complexity, fn) for name, complexity, fn in ALGORITHMS}
+    names = names or list(table)
+    runner = JobRunner().start()
+    parallel = ParallelSweep(names)
+    parallel.start(runner)
+    print(f"Sweeping {len(names)} algorithms on {runner.workers} worker(s)…")
+    while not parallel.done:
+        parallel.handle(runner.results.get(), runner)
+    runner.close()
+
+    for result in parallel.results:
+        declared = table[result.name][0]
+        if not result.sizes:
+            print(f"{result.name:<20} timed out at n = {DEFAULT_SIZES[0]:,}")
+            continue
+        flag = ""
+        if declared in MODELS and result.best_model != declared:
+            flag = "   <-- differs from declared"
+        print(f"{result.name:<20} n ≤ {result.sizes[-1]:>10,}  "
+              f"t ~ n^{result.exponent:.2f}  best fit {result.best_model}"
+              f" (c = {result.constant:.3g} s)  declared {declared}{flag}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
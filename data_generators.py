@@ -0,0 +1,210 @@
+"""
+Input distributions for the sorting benchmarks.
+
+Every generator is seeded, so the same (distribution, n, seed) always gives
+the same data. Values are produced as a NumPy int64 array when NumPy is
+installed and as an array('q') otherwise, both of which are built without a
+per-element Python loop wherever possible; generate() converts the result to
+a list for the pure-Python algorithms. The two backends use different random
+number generators, so a given seed is only reproducible on the same backend.
+
+Usage:
+    from data_generators import generate
+    data = generate("nearly_sorted", 1_000_000, seed=42)
+"""
+import random
+from array import array
+from itertools import accumulate
+
+
+_numpy = None
+
+
+def load_numpy():
+    """Import NumPy on first use; returns None when it is not installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+# ──────────────────────────────────────────────
+# Distributions
+# ──────────────────────────────────────────────
+def uniform(n, seed, lo, hi):
+    np = load_numpy()
+    if np:
+        return np.random.default_rng(seed).integers(lo, hi + 1, n, dtype=np.int64)
+    rng = random.Random(seed)
+    return array("q", [rng.randint(lo, hi) for _ in range(n)])
+
+
+def sorted_values(n, seed, lo, hi):
+    values = uniform(n, seed, lo, hi)
+    np = load_numpy()
+    if np:
+        values.sort()
+        return values
+    return array("q", sorted(values))
+
+
+def reverse_sorted(n, seed, lo, hi):
+    return sorted_values(n, seed, lo, hi)[::-1]
+
+
+def nearly_sorted(n, seed, lo, hi, swaps=None):
+    """Sorted values with `swaps` random pairs exchanged (default 1% of n)."""
+    values = sorted_values(n, seed, lo, hi)
+    if n < 2:
+        return values
+    swaps = max(1, n // 100) if swaps is None else swaps
+    rng = random.Random(seed)
+    for _ in range(swaps):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        values[i], values[j] = values[j], values[i]
+    return values
+
+
+def organ_pipe(n, seed, lo, hi):
+    """Ascending to the middle, then descending: 1 2 3 .. 3 2 1."""
+    half = max((n + 1) // 2, 1)
+    np = load_numpy()
+    if np:
+        ramp = np.minimum(np.arange(n), n - 1 - np.arange(n))
+        return lo + ramp * (hi - lo) // half
+    return array("q", [lo + min(i, n - 1 - i) * (hi - lo) // half for i in range(n)])
+
+
+def few_unique(n, seed, lo, hi, unique=8):
+    """Values drawn from only `unique` distinct keys."""
+    np = load_numpy()
+    if np:
+        rng = np.random.default_rng(seed)
+        keys = rng.integers(lo, hi + 1, unique, dtype=np.int64)
+        return keys[rng.integers(0, unique, n)]
+    rng = random.Random(seed)
+    keys = [rng.randint(lo, hi) for _ in range(unique)]
+    return array("q", rng.choices(keys, k=n))
+
+
+def all_equal(n, seed, lo, hi):
+    value = (lo + hi) // 2
+    np = load_numpy()
+    if np:
+        return np.full(n, value, dtype=np.int64)
+    return array("q", [value]) * n
+
+
+def sawtooth(n, seed, lo, hi, period=None):
+    """Repeated ascending ramps of length `period` (default sqrt(n))."""
+    period = period or max(int(n ** 0.5), 2)
+    np = load_numpy()
+    if np:
+        return lo + (np.arange(n) % period) * (hi - lo) // period
+    return array("q", [lo + (i % period) * (hi - lo) // period for i in range(n)])
+
+
+def gaussian(n, seed, lo, hi):
+    """Normal around the middle of [lo, hi], sigma = range / 6, clipped."""
+    mean = (lo + hi) / 2
+    sigma = max((hi - lo) / 6, 1e-9)
+    np = load_numpy()
+    if np:
+        values = np.random.default_rng(seed).normal(mean, sigma, n)
+        return np.clip(np.rint(values), lo, hi).astype(np.int64)
+    rng = random.Random(seed)
+    return array("q", [min(max(round(rng.gauss(mean, sigma)), lo), hi) for _ in range(n)])
+
+
+def zipfian(n, seed, lo, hi, exponent=1.2, support=10_000):
+    """Rank-frequency (Zipf) law: lo is the most common value, lo + 1 next..."""
+    support = max(min(support, hi - lo + 1), 1)
+    weights = [1 / rank ** exponent for rank in range(1, support + 1)]
+    np = load_numpy()
+    if np:
+        p = np.array(weights)
+        return lo + np.random.default_rng(seed).choice(support, n, p=p / p.sum())
+    rng = random.Random(seed)
+    return array("q", [lo + k for k in rng.choices(range(support),
+                                                  cum_weights=list(accumulate(weights)), k=n)])
+
+
+def quicksort_killer(n, seed, lo, hi):
+    """
+    Adversarial input for this project's quick_sort, built with McIlroy's
+    "A Killer Adversary for Quicksort": quick_sort runs once on placeholder
+    objects whose values are only fixed ("frozen") when a comparison forces
+    it, always in the way that keeps the pivot candidate as small as
+    possible. The resulting values drive quick_sort into its deepest
+    partitioning (and so its heapsort fallback). Costs one sort of n Python
+    objects to build. Values are lo, lo + 1, ... in the adversarial order.
+    """
+    from algorithm_functions import quick_sort
+
+    gas = n
+    values = [gas] * n
+    state = {"solid": 0, "candidate": 0}
+
+    def freeze(i):
+        values[i] = state["solid"]
+        state["solid"] += 1
+
+    def compare(x, y):
+        if values[x] == gas and values[y] == gas:
+            freeze(x if x == state["candidate"] else y)
+        if values[x] == gas:
+            state["candidate"] = x
+        elif values[y] == gas:
+            state["candidate"] = y
+        return values[x] - values[y]
+
+    class Probe:
+        __slots__ = ("i",)
+
+        def __init__(self, i):
+            self.i = i
+
+        def __lt__(self, other):
+            return compare(self.i, other.i) < 0
+
+        def __gt__(self, other):
+            return compare(self.i, other.i) > 0
+
+    quick_sort([Probe(i) for i in range(n)])
+    for i in range(n):
+        if values[i] == gas:
+            freeze(i)
+    return array("q", [lo + v for v in values])
+
+
+DISTRIBUTIONS = {
+    "uniform":          uniform,
+    "sorted":           sorted_values,
+    "reverse_sorted":   reverse_sorted,
+    "nearly_sorted":    nearly_sorted,
+    "organ_pipe":       organ_pipe,
+    "few_unique":       few_unique,
+    "all_equal":        all_equal,
+    "sawtooth":         sawtooth,
+    "gaussian":         gaussian,
+    "zipfian":          zipfian,
+    "quicksort_killer": quicksort_killer,
+}
+
+
+def generate_array(distribution, n, seed=None, lo=1, hi=1_000_000, **options):
+    """Return n values as an int64 ndarray (or array('q') without NumPy)."""
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}; "
+                         f"choose from {', '.join(DISTRIBUTIONS)}")
+    return DISTRIBUTIONS[distribution](n, seed, lo, hi, **options)
+
+
+def generate(distribution, n, seed=None, lo=1, hi=1_000_000, **options):
+    """Return n values of the given distribution as a list of ints."""
+    return generate_array(distribution, n, seed, lo, hi, **options).tolist()
@@ -0,0 +1,144 @@
+"""
+On-disk cache of generated benchmark inputs.
+
+Generating a large input (above all quicksort_killer, or any distribution
+without NumPy) can take longer than sorting it, and every benchmark, sweep
+and worker process used to do it again. generate_array() here has the same
+signature as in data_generators, but writes each (distribution, n, seed,
+lo, hi, dtype) dataset once as a raw binary file and memory-maps it on
+later calls, so reloading costs a page-cache copy instead of a Python loop.
+
+Files live in .dataset_cache/ next to this module. When their total size
+exceeds MAX_CACHE_BYTES the least recently used ones are deleted; a hit
+refreshes a file's modification time. Inputs smaller than MIN_CACHED_SIZE,
+unseeded inputs and inputs with extra generator options are not cached.
+
+Usage:
+    from dataset_cache import generate_array, generate
+    values = generate_array("uniform", 10_000_000, seed=1)   # read-only, mapped
+    data = generate("uniform", 10_000_000, seed=1)           # list of ints
+    buffer = generate_buffer("uniform", 10_000_000, seed=1)  # writable array('q')
+"""
+import mmap
+import os
+import tempfile
+from array import array
+
+from data_generators import DISTRIBUTIONS, load_numpy, generate_array as generate_fresh
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".dataset_cache")
+MAX_CACHE_BYTES = 2 * 1024 ** 3
+MIN_CACHED_SIZE = 10_000
+DTYPES = {"int64": "q", "float64": "d"}
+
+
+def cache_path(distribution, n, seed, lo, hi, dtype):
+    # NumPy and the pure-Python fallback draw different values for a seed
+    source = "np" if load_numpy() else "py"
+    return os.path.join(CACHE_DIR, f"{distribution}-{n}-{seed}-{lo}-{hi}-{dtype}-{source}.bin")
+
+
+def generate_array(distribution, n, seed=None, lo=1, hi=1_000_000, dtype="int64", **options):
+    """
+    Like data_generators.generate_array, but served from the cache. Cached
+    results are read-only memory maps (a numpy.memmap, or a memoryview
+    without NumPy); take a copy before sorting them in place.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}; "
+                         f"choose from {', '.join(DISTRIBUTIONS)}")
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype {dtype!r}; choose from {', '.join(DTYPES)}")
+    if seed is None or options or n < MIN_CACHED_SIZE:
+        return convert(generate_fresh(distribution, n, seed, lo, hi, **options), dtype)
+
+    path = cache_path(distribution, n, seed, lo, hi, dtype)
+    if os.path.exists(path):
+        try:
+            os.utime(path)
+            return open_mapped(path, n, dtype)
+        except OSError:
+            pass  # evicted by another process meanwhile; regenerate
+
+    values = convert(generate_fresh(distribution, n, seed, lo, hi), dtype)
+    write_atomic(path, values)
+    evict(MAX_CACHE_BYTES, keep=path)
+    return values
+
+
+def generate(distribution, n, seed=None, lo=1, hi=1_000_000, **options):
+    """Return n cached values of the given distribution as a list of ints."""
+    return generate_array(distribution, n, seed, lo, hi, **options).tolist()
+
+
+def generate_buffer(distribution, n, seed=None, lo=1, hi=1_000_000, dtype="int64", **options):
+    """
+    Return the cached values as a writable array.array (typecode 'q' or
+    'd'), copied byte for byte, without going through a list.
+    """
+    buffer = array(DTYPES[dtype])
+    buffer.frombytes(memoryview(generate_array(distribution, n, seed, lo, hi, dtype, **options)).cast("B"))
+    return buffer
+
+
+def convert(values, dtype):
+    np = load_numpy()
+    if np:
+        return np.ascontiguousarray(values, dtype=dtype)
+    if values.typecode != DTYPES[dtype]:
+        return array(DTYPES[dtype], values)
+    return values
+
+
+def open_mapped(path, n, dtype):
+    np = load_numpy()
+    if np:
+        return np.memmap(path, dtype=dtype, mode="r", shape=(n,))
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(DTYPES[dtype])
+
+
+def write_atomic(path, values):
+    """Write values' raw bytes so that readers never see a partial file."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(memoryview(values).cast("B"))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def evict(max_bytes=MAX_CACHE_BYTES, keep=None):
+    """Delete least recently used files until the cache fits in max_bytes."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.endswith(".bin"):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass  # still mapped elsewhere (Windows) or already gone
+
+
+def clear():
+    """Delete every cached dataset."""
+    evict(0)
@@ -0,0 +1,200 @@
+"""
+External (out-of-core) merge sort for integer files larger than RAM.
+
+The input is read in fixed-size chunks, each chunk is sorted in memory with
+merge_sort or quick_sort and spilled to a temporary run file of raw int64
+values, and the runs are then k-way merged into the output file through
+memory-mapped reads and batched writes.
+
+Two file formats are supported:
+    text    one integer per line
+    binary  native-endian int64 values back to back
+
+Usage:
+    python external_sort.py data.txt sorted.txt --memory-limit 256M
+    python external_sort.py data.bin sorted.bin --format binary --run-size 1000000
+"""
+import argparse
+import heapq
+import mmap
+import os
+import tempfile
+import time
+from array import array
+from itertools import islice
+
+from algorithm_functions import merge_sort, quick_sort
+
+
+SORT_FUNCTIONS = {"merge": merge_sort, "quick": quick_sort}
+
+# In-memory cost of one value while a chunk is being sorted: the list slot
+# (8), the int object (28-32), merge_sort's scratch slot (8) and the int64
+# written to the run file (8). Measured with tracemalloc on random 64-bit
+# values, the peak is about 59 bytes per value for merge and 52 for quick.
+BYTES_PER_VALUE = 64
+VALUE_SIZE = array("q").itemsize
+
+WRITE_BATCH = 64 * 1024   # values per output write, at most
+# A text batch costs ~140 bytes per value (int, str and the joined line),
+# so the batch is also capped at a quarter of a run to stay in the budget.
+BATCHES_PER_RUN = 4
+MAX_FAN_IN = 64           # run files merged (and kept open) at once
+
+
+def external_sort(input_path, output_path, fmt="text", memory_limit=64 * 1024 * 1024,
+                  run_size=None, algorithm="merge", tmp_dir=None, max_fan_in=MAX_FAN_IN):
+    """
+    Sort the integers in input_path into output_path using bounded memory.
+
+    run_size (values per in-memory chunk) defaults to what fits in
+    memory_limit bytes. Returns a dict of statistics: values, bytes read,
+    number of runs, merge passes and elapsed seconds.
+    """
+    if fmt not in ("text", "binary"):
+        raise ValueError(f"Unknown format {fmt!r}; expected 'text' or 'binary'")
+    sort_fn = SORT_FUNCTIONS[algorithm]
+    run_size = run_size or max(memory_limit // BYTES_PER_VALUE, 1)
+    batch = max(min(WRITE_BATCH, run_size // BATCHES_PER_RUN), 1)
+
+    start = time.perf_counter()
+    values = 0
+    with tempfile.TemporaryDirectory(prefix="external_sort_", dir=tmp_dir) as work_dir:
+        runs = []
+        for chunk in read_chunks(input_path, fmt, run_size):
+            values += len(chunk)
+            run_path = os.path.join(work_dir, f"run_{len(runs):06d}.bin")
+            with open(run_path, "wb") as f:
+                array("q", sort_fn(chunk)).tofile(f)
+            runs.append(run_path)
+            # Free this chunk before the next one is read
+            del chunk
+        run_count = len(runs)
+
+        # Merge in passes of at most max_fan_in runs until one pass can
+        # write the final output.
+        passes = 1
+        while len(runs) > max_fan_in:
+            merged = []
+            for i in range(0, len(runs), max_fan_in):
+                run_path = os.path.join(work_dir, f"pass{passes}_{len(merged):06d}.bin")
+                merge_runs(runs[i:i + max_fan_in], run_path, "binary", batch)
+                merged.append(run_path)
+            for run_path in runs:
+                os.remove(run_path)
+            runs = merged
+            passes += 1
+
+        merge_runs(runs, output_path, fmt, batch)
+
+    return {
+        "values": values,
+        "bytes": os.path.getsize(input_path),
+        "runs": run_count,
+        "passes": passes,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def read_chunks(path, fmt, run_size):
+    """
+    Yield successive lists of at most run_size integers from path. Nothing
+    but the list is kept alive while the caller sorts it.
+    """
+    if fmt == "binary":
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(run_size * VALUE_SIZE)
+                if not data:
+                    return
+                chunk = array("q")
+                chunk.frombytes(data)
+                del data
+                values = chunk.tolist()
+                del chunk
+                yield values
+                del values
+    else:
+        with open(path, "r") as f:
+            chunk = []
+            for line in f:
+                # Blank lines are skipped, however many there are in a row
+                if line.strip():
+                    chunk.append(int(line))
+                    if len(chunk) == run_size:
+                        yield chunk
+                        chunk = []
+            if chunk:
+                yield chunk
+
+
+def merge_runs(run_paths, output_path, fmt, batch_size=WRITE_BATCH):
+    """k-way merge the sorted int64 run files into output_path, batch_size values per write."""
+    files, maps, views = [], [], []
+    try:
+        for path in run_paths:
+            if os.path.getsize(path) == 0:
+                continue
+            f = open(path, "rb")
+            files.append(f)
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            maps.append(mm)
+            views.append(memoryview(mm).cast("q"))
+
+        with open(output_path, "wb" if fmt == "binary" else "w") as out:
+            merged = heapq.merge(*views)
+            while True:
+                batch = list(islice(merged, batch_size))
+                if not batch:
+                    break
+                if fmt == "binary":
+                    array("q", batch).tofile(out)
+                else:
+                    out.write("\n".join(map(str, batch)))
+                    out.write("\n")
+            del merged
+    finally:
+        for view in views:
+            view.release()
+        for mm in maps:
+            mm.close()
+        for f in files:
+            f.close()
+
+
+def parse_size(text):
+    """Parse a byte count such as 512K, 256M or 2G."""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sort an integer file larger than RAM.")
+    parser.add_argument("input", help="file to sort")
+    parser.add_argument("output", help="where to write the sorted values")
+    parser.add_argument("--format", choices=("text", "binary"), default="text",
+                        help="text: one integer per line; binary: native int64 values")
+    parser.add_argument("--memory-limit", type=parse_size, default=64 * 1024 * 1024,
+                        help="memory budget for in-memory chunks, e.g. 256M (default 64M)")
+    parser.add_argument("--run-size", type=int, default=None,
+                        help="values per sorted run (overrides --memory-limit)")
+    parser.add_argument("--algorithm", choices=sorted(SORT_FUNCTIONS), default="merge",
+                        help="in-memory sort used for each run")
+    parser.add_argument("--tmp-dir", default=None, help="directory for run files")
+    args = parser.parse_args(argv)
+
+    stats = external_sort(args.input, args.output, args.format, args.memory_limit,
+                          args.run_size, args.algorithm, args.tmp_dir)
+
+    mb = stats["bytes"] / (1024 * 1024)
+    print(f"Sorted {stats['values']:,} values ({mb:.1f} MB) "
+          f"in {stats['runs']} runs and {stats['passes']} merge pass(es)")
+    print(f"Time taken: {stats['seconds']:.3f} seconds  "
+          f"({mb / stats['seconds']:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
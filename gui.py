@@ -1,12 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import time
+import math
+import queue
 import random
 import threading
-import copy
 
-# Import the sorting functions from algorithm_functions.py
-from algorithm_functions import selection_sort, bubble_sort, merge_sort, quick_sort
+# Import the algorithm table shared with the CLI
+from algorithm_registry import ALGORITHMS, numpy_algorithms, backend_of, make_input
+from benchmark import Measurement, format_time
+from instrumented_functions import count_operations, format_count
+from memory_profile import PROFILE_TIMEOUT, profile_memory, format_bytes
+from data_generators import DISTRIBUTIONS
+from dataset_cache import generate_array
+from complexity import MODELS, ParallelSweep, SweepResult
+from job_runner import Job, JobRunner
+from result_store import ResultStore
+from algorithm_functions import choose_algorithm
+from parallel_sort import parallel_merge_sort
 
 
 # ──────────────────────────────────────────────
@@ -27,20 +37,35 @@ FONT_FAMILY   = "Segoe UI"
 ALGO_COLOURS = {
     "Selection Sort": "#f38ba8",  # pink
     "Bubble Sort":    "#fab387",  # peach
+    "Bubble Sort (early exit)": "#eba0ac",  # maroon
+    "Cocktail Shaker Sort":  "#f5e0dc",  # rosewater
+    "Binary Insertion Sort": "#b4befe",  # lavender
+    "Shell Sort (Ciura)":    "#74c7ec",  # sapphire
+    "Shell Sort (Tokuda)":   "#89dceb",  # sky
+    "Comb Sort":             "#bac2de",  # subtext
     "Merge Sort":     "#a6e3a1",  # green
+    "Tim Sort":       "#b8e6a0",  # light green
     "Quick Sort":     "#89b4fa",  # blue
+    "Parallel Merge Sort": "#94e2d5",  # teal
+    "Counting Sort":  "#f9e2af",  # yellow
+    "Radix Sort":     "#cba6f7",  # mauve
+    "Bucket Sort":    "#f5c2e7",  # rose
+    "Adaptive Sort":  "#f2cdcd",  # flamingo
+    # NumPy variants – deeper shades of the pure‑Python colours
+    "Selection Sort (NumPy)": "#d20f39",
+    "Bubble Sort (NumPy)":    "#fe640b",
+    "Merge Sort (NumPy)":     "#40a02b",
+    "Quick Sort (NumPy)":     "#1e66f5",
+    "Counting Sort (NumPy)":  "#df8e1d",
+    "Radix Sort (NumPy)":     "#8839ef",
 }
 
 
 # ──────────────────────────────────────────────
 # Algorithm Definitions
 # ──────────────────────────────────────────────
-ALGORITHMS = [
-    ("Selection Sort", "O(n²)",      selection_sort),
-    ("Bubble Sort",    "O(n²)",      bubble_sort),
-    ("Merge Sort",     "O(n log n)", merge_sort),
-    ("Quick Sort",     "O(n log n)", quick_sort),
-]
+# Pure‑Python algorithms plus their NumPy variants (if NumPy is installed)
+ALGORITHMS = ALGORITHMS + numpy_algorithms()
 
 
 # ──────────────────────────────────────────────
@@ -51,7 +76,7 @@ root.title("Sorting Algorithm Benchmark")
 root.configure(bg=BG_DARK)
 root.resizable(False, False)
 
-window_width, window_height = 560, 780
+window_width, window_height = 960, 780
 screen_w = root.winfo_screenwidth()
 screen_h = root.winfo_screenheight()
 x_pos = (screen_w - window_width) // 2
@@ -134,7 +159,98 @@ num_entry = tk.Entry(
     highlightthickness=1, highlightbackground=BORDER_COLOR,
     highlightcolor=ACCENT, justify="center",
 )
-num_entry.pack(padx=20, pady=(10, 18), ipady=6, fill="x")
+num_entry.pack(padx=20, pady=(10, 12), ipady=6, fill="x")
+
+tk.Label(
+    input_card, text="Timed Repeats",
+    font=(FONT_FAMILY, 11, "bold"), fg=FG_PRIMARY, bg=BG_CARD, anchor="w",
+).pack(padx=20, pady=(4, 4), fill="x")
+
+tk.Label(
+    input_card,
+    text="Runs are spread over one worker process per core (after a warm‑up run);\n"
+         "a run longer than the timeout is stopped and its algorithm skipped.",
+    font=(FONT_FAMILY, 9), fg=FG_SECONDARY, bg=BG_CARD, anchor="w", justify="left",
+).pack(padx=20, fill="x")
+
+repeats_row = tk.Frame(input_card, bg=BG_CARD)
+repeats_row.pack(padx=20, pady=(10, 12), fill="x")
+
+repeats_var = tk.StringVar(value="5")
+repeats_entry = tk.Entry(
+    repeats_row, textvariable=repeats_var,
+    font=(FONT_FAMILY, 13), fg=FG_PRIMARY, bg=BG_INPUT,
+    insertbackground=ACCENT, relief="flat",
+    highlightthickness=1, highlightbackground=BORDER_COLOR,
+    highlightcolor=ACCENT, justify="center",
+)
+repeats_entry.pack(side="left", ipady=6, fill="x", expand=True)
+
+timeout_var = tk.StringVar(value="60")
+tk.Entry(
+    repeats_row, textvariable=timeout_var,
+    font=(FONT_FAMILY, 13), fg=FG_PRIMARY, bg=BG_INPUT,
+    insertbackground=ACCENT, relief="flat",
+    highlightthickness=1, highlightbackground=BORDER_COLOR,
+    highlightcolor=ACCENT, justify="center", width=8,
+).pack(side="right", ipady=6)
+tk.Label(
+    repeats_row, text="Timeout per run (s)", font=(FONT_FAMILY, 9),
+    fg=FG_SECONDARY, bg=BG_CARD,
+).pack(side="right", padx=(12, 8))
+
+tk.Label(
+    input_card, text="Input Distribution & Seed",
+    font=(FONT_FAMILY, 11, "bold"), fg=FG_PRIMARY, bg=BG_CARD, anchor="w",
+).pack(padx=20, pady=(4, 4), fill="x")
+
+tk.Label(
+    input_card,
+    text="Shape of the generated data; leave the seed blank for a fresh one.",
+    font=(FONT_FAMILY, 9), fg=FG_SECONDARY, bg=BG_CARD, anchor="w",
+).pack(padx=20, fill="x")
+
+dist_row = tk.Frame(input_card, bg=BG_CARD)
+dist_row.pack(padx=20, pady=(10, 12), fill="x")
+
+dist_var = tk.StringVar(value="uniform")
+ttk.Combobox(
+    dist_row, textvariable=dist_var, values=list(DISTRIBUTIONS),
+    state="readonly", font=(FONT_FAMILY, 11), width=18,
+).pack(side="left", ipady=4)
+
+seed_var = tk.StringVar(value="")
+tk.Entry(
+    dist_row, textvariable=seed_var,
+    font=(FONT_FAMILY, 13), fg=FG_PRIMARY, bg=BG_INPUT,
+    insertbackground=ACCENT, relief="flat",
+    highlightthickness=1, highlightbackground=BORDER_COLOR,
+    highlightcolor=ACCENT, justify="center", width=12,
+).pack(side="right", ipady=6)
+tk.Label(
+    dist_row, text="Seed", font=(FONT_FAMILY, 9),
+    fg=FG_SECONDARY, bg=BG_CARD,
+).pack(side="right", padx=(0, 8))
+
+# Opt‑in operation counting (separate, untimed instrumented run)
+count_ops_var = tk.BooleanVar(value=False)
+tk.Checkbutton(
+    input_card, text="Count operations (comparisons, moves, allocations, depth)",
+    variable=count_ops_var,
+    font=(FONT_FAMILY, 10), fg=FG_PRIMARY, bg=BG_CARD,
+    selectcolor=BG_INPUT, activebackground=BG_CARD,
+    activeforeground=ACCENT, highlightthickness=0, bd=0, anchor="w",
+).pack(padx=20, pady=(0, 4), fill="x")
+
+# Opt‑in memory profiling (one fresh subprocess per algorithm)
+profile_mem_var = tk.BooleanVar(value=False)
+tk.Checkbutton(
+    input_card, text="Profile memory (peak, bytes per element; isolated subprocess)",
+    variable=profile_mem_var,
+    font=(FONT_FAMILY, 10), fg=FG_PRIMARY, bg=BG_CARD,
+    selectcolor=BG_INPUT, activebackground=BG_CARD,
+    activeforeground=ACCENT, highlightthickness=0, bd=0, anchor="w",
+).pack(padx=20, pady=(0, 16), fill="x")
 
 
 # ──────────────────────────────────────────────
@@ -223,6 +339,24 @@ run_btn.pack(padx=32, ipady=10, fill="x")
 run_btn.bind("<Enter>", lambda e: run_btn.configure(bg=ACCENT_HOVER))
 run_btn.bind("<Leave>", lambda e: run_btn.configure(bg=ACCENT))
 
+# Scaling sweep: times each selected algorithm over growing n (log‑log plot)
+sweep_btn = tk.Button(
+    scroll_frame, text="Run Scaling Sweep  (time vs. n)",
+    font=(FONT_FAMILY, 10, "bold"), fg=ACCENT, bg=BG_INPUT,
+    activebackground=BORDER_COLOR, activeforeground=ACCENT_HOVER,
+    relief="flat", cursor="hand2", disabledforeground="#666680",
+)
+sweep_btn.pack(padx=32, pady=(8, 0), ipady=6, fill="x")
+
+# Stops a running benchmark or sweep by killing its worker processes
+cancel_btn = tk.Button(
+    scroll_frame, text="Cancel", state="disabled",
+    font=(FONT_FAMILY, 10, "bold"), fg="#f38ba8", bg=BG_INPUT,
+    activebackground=BORDER_COLOR, activeforeground="#f38ba8",
+    relief="flat", cursor="hand2", disabledforeground="#666680",
+)
+cancel_btn.pack(padx=32, pady=(8, 0), ipady=4, fill="x")
+
 # Status label (shows "Running…" / "Done" feedback)
 status_var = tk.StringVar(value="")
 status_label = tk.Label(
@@ -238,131 +372,338 @@ status_label.pack(pady=(6, 0))
 results_card = make_card(scroll_frame)
 # Not packed yet – shown after first benchmark run
 
-BAR_CHART_HEIGHT = 220
-BAR_CHART_PAD    = 32
+BAR_HEIGHT   = 28
+BAR_GAP      = 16
+BAR_LEFT     = 140     # bars start right of the algorithm labels
+MAX_BARS     = 24      # further results are listed in the table only
+TABLE_ROWS   = 12      # visible rows; the Treeview only draws these
+REFRESH_MS   = 200     # ranks and bar scale are redrawn at most this often
+
+tk.Label(
+    results_card, text="Results",
+    font=(FONT_FAMILY, 11, "bold"), fg=FG_PRIMARY, bg=BG_CARD, anchor="w",
+).pack(padx=20, pady=(16, 10), fill="x")
+
+chart_canvas = tk.Canvas(results_card, bg=BG_CARD, highlightthickness=0, height=0)
+chart_canvas.pack(padx=20, pady=(0, 10), fill="x")
+
+# (column id, heading, width, anchor); the count and memory columns are only
+# displayed when counting / profiling was requested.
+BASE_COLUMNS = [
+    ("algorithm", "Algorithm", 200, "w"),
+    ("runs",      "Runs",       50, "e"),
+    ("median",    "Median",     90, "e"),
+    ("ci95",      "± 95% CI",   80, "e"),
+    ("p95",       "p95",        80, "e"),
+    ("rank",      "Rank",       50, "center"),
+]
+COUNT_COLUMNS = [
+    ("comparisons", "Cmp",    60, "e"),
+    ("moves",       "Moves",  60, "e"),
+    ("allocations", "Allocs", 60, "e"),
+    ("max_depth",   "Depth",  50, "e"),
+]
+MEMORY_COLUMNS = [
+    ("traced_peak",       "Peak mem", 80, "e"),
+    ("bytes_per_element", "B/elem",   60, "e"),
+    ("peak_rss",          "RSS Δ",    80, "e"),
+]
+ALL_COLUMNS = BASE_COLUMNS + COUNT_COLUMNS + MEMORY_COLUMNS
+
+style = ttk.Style()
+style.configure("Results.Treeview", background=BG_INPUT, fieldbackground=BG_INPUT,
+                foreground=FG_PRIMARY, rowheight=26, borderwidth=0, font=(FONT_FAMILY, 10))
+style.configure("Results.Treeview.Heading", background=BORDER_COLOR,
+                foreground=FG_SECONDARY, relief="flat", font=(FONT_FAMILY, 9, "bold"))
+
+table_frame = tk.Frame(results_card, bg=BG_CARD)
+table_frame.pack(padx=20, pady=(0, 18), fill="x")
 
-chart_canvas = tk.Canvas(
-    results_card, bg=BG_CARD, highlightthickness=0,
-    height=BAR_CHART_HEIGHT,
+results_tree = ttk.Treeview(
+    table_frame, columns=[c[0] for c in ALL_COLUMNS], show="headings",
+    height=TABLE_ROWS, style="Results.Treeview", selectmode="browse",
 )
+for column, heading, width, anchor in ALL_COLUMNS:
+    results_tree.heading(column, text=heading)
+    results_tree.column(column, width=width, anchor=anchor, stretch=(column == "algorithm"))
+results_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=results_tree.yview)
+results_tree.configure(yscrollcommand=results_scroll.set)
+results_tree.pack(side="left", fill="x", expand=True)
+results_scroll.pack(side="right", fill="y")
 
-results_table_frame = tk.Frame(results_card, bg=BG_CARD)
 
+def _on_table_mousewheel(event):
+    # Scroll the table rather than the page under it
+    results_tree.yview_scroll(int(-1 * (event.delta / 120)), "units")
+    return "break"
 
-def show_results(results: list[tuple[str, float]]):
+results_tree.bind("<MouseWheel>", _on_table_mousewheel)
+
+results_tree.tag_configure("odd", background=BG_CARD)
+for algo_name, algo_colour in ALGO_COLOURS.items():
+    results_tree.tag_configure(algo_name, foreground=algo_colour)
+
+# What is on screen: one row (and maybe one bar) per result, updated in place
+shown_results = {}     # name -> Measurement
+bar_items = {}         # name -> (y, bar item, time text item)
+rank_texts = {}        # name -> rank text currently shown
+refresh_pending = False
+
+
+def clear_results(extra_columns=()):
+    """Empty the table and chart (widgets are kept) and show the card."""
+    results_card.pack(padx=32, pady=(16, 24), fill="x")
+    results_tree.delete(*results_tree.get_children())
+    chart_canvas.delete("all")
+    chart_canvas.configure(height=0)
+    shown_results.clear()
+    bar_items.clear()
+    rank_texts.clear()
+    results_tree["displaycolumns"] = [c[0] for c in BASE_COLUMNS + list(extra_columns)]
+
+
+def row_values(result: Measurement):
+    timed = bool(result.times)
+    values = [
+        f"● {result.name}", len(result.times),
+        format_time(result.median) if timed else "…",
+        format_time(result.ci95) if timed else "",
+        format_time(result.p95) if timed else "",
+        "✗ invalid" if result.invalid else rank_texts.get(result.name, ""),
+    ]
+    counts = result.counts
+    values += [format_count(getattr(counts, c[0])) if counts else "–" for c in COUNT_COLUMNS]
+    mem = result.memory
+    values += ([format_bytes(mem.traced_peak), f"{mem.bytes_per_element:.1f}",
+                format_bytes(mem.peak_rss)] if mem else ["–"] * len(MEMORY_COLUMNS))
+    return values
+
+
+def show_result(result: Measurement):
+    """Insert or update the row (and bar) of one algorithm as runs come in."""
+    name = result.name
+    if results_tree.exists(name):
+        results_tree.item(name, values=row_values(result))
+    else:
+        stripe = "odd" if len(shown_results) % 2 else "even"
+        results_tree.insert("", "end", iid=name, values=row_values(result), tags=(name, stripe))
+        if len(bar_items) < MAX_BARS:
+            y = 16 + len(bar_items) * (BAR_HEIGHT + BAR_GAP)
+            chart_canvas.create_text(BAR_LEFT - 10, y + BAR_HEIGHT // 2, text=name, anchor="e",
+                                     fill=FG_PRIMARY, font=(FONT_FAMILY, 10))
+            bar = chart_canvas.create_rectangle(BAR_LEFT, y, BAR_LEFT, y + BAR_HEIGHT,
+                                                fill=ALGO_COLOURS.get(name, ACCENT), outline="")
+            text = chart_canvas.create_text(BAR_LEFT + 8, y + BAR_HEIGHT // 2, text="…",
+                                            anchor="w", fill=FG_SECONDARY, font=(FONT_FAMILY, 9))
+            bar_items[name] = (y, bar, text)
+            chart_canvas.configure(height=y + BAR_HEIGHT + BAR_GAP)
+    shown_results[name] = result
+    schedule_refresh()
+
+
+def mark_result(name, text):
+    """Show a status such as "timed out" in place of a row's timings."""
+    if results_tree.exists(name):
+        results_tree.set(name, "median", text)
+    if name in bar_items:
+        chart_canvas.itemconfigure(bar_items[name][2], text=text)
+
+
+def schedule_refresh():
+    global refresh_pending
+    if not refresh_pending:
+        refresh_pending = True
+        root.after(REFRESH_MS, refresh_results)
+
+
+def refresh_results():
+    """
+    Re‑rank the rows and rescale the bars. Only changed cells and canvas
+    coordinates are touched, and streaming updates are batched into one
+    refresh per REFRESH_MS, so the event loop stays responsive.
     """
-    Display benchmark results as a horizontal bar chart + timing table.
+    global refresh_pending
+    refresh_pending = False
+    timed = sorted((r for r in shown_results.values() if r.times), key=lambda r: r.median)
+
+    # Results whose output failed verification are not ranked
+    for rank, result in enumerate((r for r in timed if not r.invalid), start=1):
+        text = "🥇" if rank == 1 else ("🥈" if rank == 2 else ("🥉" if rank == 3 else f"#{rank}"))
+        if rank_texts.get(result.name) != text:
+            rank_texts[result.name] = text
+            results_tree.set(result.name, "rank", text)
+
+    max_time = timed[-1].median if timed else 0
+    usable_w = max((chart_canvas.winfo_width() or 600) - BAR_LEFT - 90, 50)
+    for name, (y, bar, text) in bar_items.items():
+        result = shown_results[name]
+        if not result.times:
+            continue
+        bar_w = max(int(result.median / (max_time or 1e-9) * usable_w), 6)
+        chart_canvas.coords(bar, BAR_LEFT, y, BAR_LEFT + bar_w, y + BAR_HEIGHT)
+        chart_canvas.coords(text, BAR_LEFT + bar_w + 8, y + BAR_HEIGHT // 2)
+        chart_canvas.itemconfigure(text, text=format_time(result.median)
+                                   + ("  ✗ invalid" if result.invalid else ""))
+
+
+def show_results(results: list[Measurement]):
+    """
+    Final update of the streamed table once a benchmark has finished: fill
+    in operation counts and memory (showing their columns if present) and
+    redraw ranks and bars. Bars show the median time; the table adds the
+    95% confidence interval of the mean and the 95th percentile.
 
     Parameters
     ----------
-    results : list of (algorithm_name, elapsed_seconds)
+    results : list of Measurement, one per algorithm
     """
-    # ── Pack the card if first time ──
-    results_card.pack(padx=32, pady=(16, 24), fill="x")
+    extra = []
+    if any(r.counts for r in results):
+        extra += COUNT_COLUMNS
+    if any(r.memory for r in results):
+        extra += MEMORY_COLUMNS
+    results_tree["displaycolumns"] = [c[0] for c in BASE_COLUMNS + extra]
+    for result in results:
+        show_result(result)
+    refresh_results()
+
+    # Scroll to bottom so results are visible
+    root.after(100, lambda: main_canvas.yview_moveto(1.0))
+
+
+sweep_card = make_card(scroll_frame)
+# Not packed yet – shown after first sweep
 
-    # ── Header ──
-    for w in results_card.winfo_children():
+
+def show_sweep(results: list[SweepResult]):
+    """
+    Plot time vs. n on log‑log axes, one line per algorithm, and list the
+    fitted exponent and best model next to the declared complexity.
+    """
+    sweep_card.pack(padx=32, pady=(16, 24), fill="x")
+    for w in sweep_card.winfo_children():
         w.destroy()
 
     tk.Label(
-        results_card, text="Results",
+        sweep_card, text="Scaling (log‑log)",
         font=(FONT_FAMILY, 11, "bold"), fg=FG_PRIMARY, bg=BG_CARD, anchor="w",
     ).pack(padx=20, pady=(16, 10), fill="x")
 
-    # ── Bar Chart (horizontal bars) ──
-    chart = tk.Canvas(
-        results_card, bg=BG_CARD, highlightthickness=0,
-        height=max(len(results) * 50 + 20, 100),
-    )
+    plot_h = 260
+    chart = tk.Canvas(sweep_card, bg=BG_CARD, highlightthickness=0, height=plot_h)
     chart.pack(padx=20, pady=(0, 10), fill="x")
-    results_card.update_idletasks()  # so winfo_width is accurate
-
-    chart_w = chart.winfo_width() or 440
-    usable_w = chart_w - 140  # leave room for labels on the left
-
-    max_time = max(t for _, t in results) if results else 1
-    if max_time == 0:
-        max_time = 1e-9  # prevent division by zero
-
-    y = 16
-    bar_h = 28
-    for name, elapsed in results:
-        colour = ALGO_COLOURS.get(name, ACCENT)
-        bar_w = max(int((elapsed / max_time) * usable_w), 6)
-
-        # Label on the left
-        chart.create_text(
-            130, y + bar_h // 2,
-            text=name, anchor="e",
-            fill=FG_PRIMARY, font=(FONT_FAMILY, 10),
-        )
-        # Bar
-        chart.create_rectangle(
-            140, y, 140 + bar_w, y + bar_h,
-            fill=colour, outline="",
-        )
-        # Time on the bar
-        time_str = format_time(elapsed)
-        chart.create_text(
-            140 + bar_w + 8, y + bar_h // 2,
-            text=time_str, anchor="w",
-            fill=FG_SECONDARY, font=(FONT_FAMILY, 9),
-        )
-        y += bar_h + 16
-
-    # ── Detailed Table ──
-    table = tk.Frame(results_card, bg=BG_CARD)
-    table.pack(padx=20, pady=(0, 18), fill="x")
+    sweep_card.update_idletasks()
+    plot_w = chart.winfo_width() or 520
 
-    # Table header
-    hdr = tk.Frame(table, bg=BORDER_COLOR)
-    hdr.pack(fill="x")
-    tk.Label(hdr, text="Algorithm", font=(FONT_FAMILY, 9, "bold"),
-             fg=FG_SECONDARY, bg=BORDER_COLOR, width=18, anchor="w").pack(side="left", padx=8, pady=4)
-    tk.Label(hdr, text="Time", font=(FONT_FAMILY, 9, "bold"),
-             fg=FG_SECONDARY, bg=BORDER_COLOR, width=14, anchor="e").pack(side="left", padx=8, pady=4)
-    tk.Label(hdr, text="Rank", font=(FONT_FAMILY, 9, "bold"),
-             fg=FG_SECONDARY, bg=BORDER_COLOR, width=6, anchor="center").pack(side="left", padx=8, pady=4)
-
-    # Sort by time for ranking
-    ranked = sorted(results, key=lambda r: r[1])
-    rank_map = {name: i + 1 for i, (name, _) in enumerate(ranked)}
-
-    for name, elapsed in results:
-        row_bg = BG_INPUT if results.index((name, elapsed)) % 2 == 0 else BG_CARD
+    points = [(n, t) for r in results for n, t in zip(r.sizes, r.times) if t > 0]
+    if not points:
+        return
+    log_n = [math.log10(n) for n, _ in points]
+    log_t = [math.log10(t) for _, t in points]
+    x_lo, x_hi = min(log_n), max(max(log_n), min(log_n) + 1)
+    y_lo, y_hi = min(log_t), max(max(log_t), min(log_t) + 1)
+    left, right, top, bottom = 56, plot_w - 12, 10, plot_h - 28
+
+    def to_xy(n, t):
+        x = left + (math.log10(n) - x_lo) / (x_hi - x_lo) * (right - left)
+        y = bottom - (math.log10(t) - y_lo) / (y_hi - y_lo) * (bottom - top)
+        return x, y
+
+    # Axes with one tick per decade
+    chart.create_line(left, top, left, bottom, right, bottom, fill=BORDER_COLOR)
+    for decade in range(math.ceil(x_lo), math.floor(x_hi) + 1):
+        x, _ = to_xy(10 ** decade, 10 ** y_lo)
+        chart.create_line(x, bottom, x, bottom + 4, fill=BORDER_COLOR)
+        chart.create_text(x, bottom + 14, text=f"10^{decade}",
+                          fill=FG_SECONDARY, font=(FONT_FAMILY, 8))
+    for decade in range(math.ceil(y_lo), math.floor(y_hi) + 1):
+        _, y = to_xy(10 ** x_lo, 10 ** decade)
+        chart.create_line(left - 4, y, left, y, fill=BORDER_COLOR)
+        chart.create_text(left - 6, y, text=format_time(10 ** decade), anchor="e",
+                          fill=FG_SECONDARY, font=(FONT_FAMILY, 8))
+
+    for r in results:
+        colour = ALGO_COLOURS.get(r.name, ACCENT)
+        coords = [c for n, t in zip(r.sizes, r.times) if t > 0 for c in to_xy(n, t)]
+        if len(coords) >= 4:
+            chart.create_line(*coords, fill=colour, width=2)
+        for i in range(0, len(coords), 2):
+            chart.create_oval(coords[i] - 2, coords[i + 1] - 2,
+                              coords[i] + 2, coords[i + 1] + 2, fill=colour, outline="")
+
+    # Fitted exponent vs. declared complexity
+    declared = {name: complexity for name, complexity, _ in ALGORITHMS}
+    table = tk.Frame(sweep_card, bg=BG_CARD)
+    table.pack(padx=20, pady=(0, 18), fill="x")
+    for i, r in enumerate(results):
+        row_bg = BG_INPUT if i % 2 == 0 else BG_CARD
         row = tk.Frame(table, bg=row_bg)
         row.pack(fill="x")
+        expected = declared.get(r.name, "")
+        mismatch = expected in MODELS and r.best_model != expected
+        tk.Label(row, text=f"● {r.name}", font=(FONT_FAMILY, 10),
+                 fg=ALGO_COLOURS.get(r.name, ACCENT), bg=row_bg, width=22,
+                 anchor="w").pack(side="left", padx=8, pady=5)
+        tk.Label(row, text=f"n^{r.exponent:.2f} → {r.best_model or '?'}",
+                 font=(FONT_FAMILY, 10), fg=FG_PRIMARY, bg=row_bg, width=20,
+                 anchor="w").pack(side="left", padx=8, pady=5)
+        tk.Label(row, text=f"{'⚠ ' if mismatch else ''}declared {expected}",
+                 font=(FONT_FAMILY, 9), fg="#f38ba8" if mismatch else FG_SECONDARY,
+                 bg=row_bg, anchor="w").pack(side="left", padx=8, pady=5)
 
-        colour = ALGO_COLOURS.get(name, ACCENT)
-        tk.Label(row, text=f"● {name}", font=(FONT_FAMILY, 10),
-                 fg=colour, bg=row_bg, width=18, anchor="w").pack(side="left", padx=8, pady=5)
-        tk.Label(row, text=format_time(elapsed), font=(FONT_FAMILY, 10),
-                 fg=FG_PRIMARY, bg=row_bg, width=14, anchor="e").pack(side="left", padx=8, pady=5)
-
-        rank = rank_map[name]
-        rank_text = "🥇" if rank == 1 else ("🥈" if rank == 2 else ("🥉" if rank == 3 else f"#{rank}"))
-        tk.Label(row, text=rank_text, font=(FONT_FAMILY, 10),
-                 fg=FG_PRIMARY, bg=row_bg, width=6, anchor="center").pack(side="left", padx=8, pady=5)
-
-    # Scroll to bottom so results are visible
     root.after(100, lambda: main_canvas.yview_moveto(1.0))
 
 
-def format_time(seconds: float) -> str:
-    """Return a human‑friendly string for a duration."""
-    if seconds < 0.001:
-        return f"{seconds * 1_000_000:.1f} µs"
-    elif seconds < 1.0:
-        return f"{seconds * 1_000:.2f} ms"
+# ──────────────────────────────────────────────
+# Benchmark Logic (worker processes, polled from the event loop)
+# ──────────────────────────────────────────────
+active_runner = None
+POLL_MS = 50
+
+
+def set_running(runner):
+    """Enable/disable the buttons around a run; runner=None when finished."""
+    global active_runner
+    active_runner = runner
+    if runner:
+        run_btn.configure(state="disabled", bg=BORDER_COLOR)
+        sweep_btn.configure(state="disabled")
+        cancel_btn.configure(state="normal")
     else:
-        return f"{seconds:.4f} s"
+        run_btn.configure(state="normal", bg=ACCENT)
+        sweep_btn.configure(state="normal")
+        cancel_btn.configure(state="disabled")
+
+
+def cancel_run():
+    if active_runner:
+        status_var.set("Cancelling…")
+        active_runner.cancel()
+
+
+cancel_btn.configure(command=cancel_run)
+
+
+def on_close():
+    if active_runner:
+        active_runner.cancel()
+    root.destroy()
+
+
+root.protocol("WM_DELETE_WINDOW", on_close)
+
+
+def drain(runner, handle):
+    """Pass every result waiting on runner.results to handle()."""
+    while True:
+        try:
+            handle(runner.results.get_nowait())
+        except queue.Empty:
+            return
 
 
-# ──────────────────────────────────────────────
-# Benchmark Logic (runs in a background thread)
-# ──────────────────────────────────────────────
 def run_benchmark():
-    """Validate inputs, run each selected algo, then display results."""
+    """Validate inputs, run each selected algo, streaming results in as they finish."""
     raw = num_var.get().strip()
     if not raw.isdigit() or int(raw) <= 0:
         messagebox.showwarning("Invalid Input",
@@ -375,39 +716,202 @@ def run_benchmark():
                                "Please select at least one sorting algorithm.")
         return
 
-    count = int(raw)
+    raw_repeats = repeats_var.get().strip()
+    if not raw_repeats.isdigit() or int(raw_repeats) <= 0:
+        messagebox.showwarning("Invalid Input",
+                               "Please enter a positive integer for the number of repeats.")
+        return
 
-    # Disable button while running
-    run_btn.configure(state="disabled", bg=BORDER_COLOR)
-    status_var.set("Generating random data…")
+    raw_seed = seed_var.get().strip()
+    if raw_seed and not raw_seed.isdigit():
+        messagebox.showwarning("Invalid Input",
+                               "The seed must be a non‑negative integer (or blank).")
+        return
 
-    def worker():
-        # Generate ONE random list; give each algorithm its own copy
-        base_list = [random.randint(1, 1_000_000) for _ in range(count)]
-        results = []
+    try:
+        timeout = float(timeout_var.get())
+    except ValueError:
+        timeout = 0
+    if timeout <= 0:
+        messagebox.showwarning("Invalid Input",
+                               "The timeout must be a positive number of seconds.")
+        return
 
-        for i, (name, sort_fn) in enumerate(selected):
-            root.after(0, lambda n=name: status_var.set(f"Running {n}…"))
-            data = copy.copy(base_list)
-            start = time.perf_counter()
-            sort_fn(data)
-            elapsed = time.perf_counter() - start
-            results.append((name, elapsed))
+    count = int(raw)
+    repeats = int(raw_repeats)
+    distribution = dist_var.get()
+    seed = int(raw_seed) if raw_seed else random.randrange(2 ** 32)
+    count_ops = count_ops_var.get()
+    profile_mem = profile_mem_var.get()
+
+    # One job per (algorithm, repetition); repetitions are interleaved so a
+    # slow algorithm does not hold back the others' first results.
+    jobs = [Job(name, count, distribution, seed, repetition, timeout=timeout)
+            for repetition in range(repeats) for name, _ in selected]
+    # Pinning would confine Parallel Merge Sort's own pool to one core
+    runner = JobRunner(pin=all(fn is not parallel_merge_sort for _, fn in selected)).start()
+    for job in jobs:
+        runner.submit(job)
+    runner.close()
+    set_running(runner)
+    status_var.set(f"Running on {runner.workers} worker process(es)…")
+
+    measurements = {name: Measurement(name) for name, _ in selected}
+    failures = {}
+    done = [0]
+    clear_results()
+    for measurement in measurements.values():
+        show_result(measurement)
+
+    def handle(result):
+        done[0] += 1
+        name = result.job.name
+        if result.status == "ok":
+            measurements[name].times.append(result.elapsed)
+            if result.invalid and not measurements[name].invalid:
+                measurements[name].invalid = result.invalid
+            if name not in failures:
+                show_result(measurements[name])
+        elif result.status != "skipped":
+            failures.setdefault(name, result)
+            if result.status == "timeout":
+                runner.skip(name)
+                mark_result(name, "timed out")
+            elif result.status == "error":
+                mark_result(name, "failed")
+            else:
+                mark_result(name, "cancelled")
+        status_var.set(f"Running on {runner.workers} worker process(es)… "
+                       f"{done[0]}/{len(jobs)} runs done (last: {name})")
+
+    def poll():
+        drain(runner, handle)
+        if done[0] < len(jobs):
+            root.after(POLL_MS, poll)
+            return
+        results = [m for name, m in measurements.items()
+                   if m.times and name not in failures]
+        notes = []
+        for name, result in failures.items():
+            if result.status == "timeout":
+                notes.append(f"{name}: stopped after the {timeout:g} s timeout")
+            elif result.status == "error":
+                notes.append(f"{name}: failed ({result.error.strip().splitlines()[-1]})")
+        for result in results:
+            if result.invalid:
+                notes.append(f"{result.name}: wrong output ({result.invalid}) – not ranked or saved")
+        threading.Thread(target=extras, args=(results, notes), daemon=True).start()
+
+    def extras(results, notes):
+        # Optional untimed extras, off the event loop. Whatever fails here,
+        # finish() must still run or Run and Sweep stay disabled.
+        try:
+            add_extras(results, notes)
+        except Exception as error:
+            notes.append(f"Extras stopped: {type(error).__name__}: {error}")
+
+        # Keep the numbers for later regression checks (result_store.py compare)
+        try:
+            store = ResultStore()
+            for result in results:
+                if not result.invalid:
+                    store.save(result, backend_of(dict(selected)[result.name]),
+                               count, distribution, seed)
+        except Exception as error:
+            notes.append(f"Results not saved: {error}")
 
-        # Update UI on the main thread
         def finish():
-            status_var.set("✓ Benchmark complete")
-            run_btn.configure(state="normal", bg=ACCENT)
-            show_results(results)
+            headline = ("Benchmark cancelled – showing the algorithms that finished"
+                        if runner.cancelled else "✓ Benchmark complete")
+            status_var.set("\n".join([f"{headline} ({distribution}, seed {seed})"] + notes))
+            set_running(None)
+            if results:
+                show_results(results)
 
         root.after(0, finish)
 
-    threading.Thread(target=worker, daemon=True).start()
+    def add_extras(results, notes):
+        names = [r.name for r in results]
+        if (count_ops or "Adaptive Sort" in names) and not runner.cancelled:
+            base = generate_array(distribution, count, seed=seed, lo=1, hi=1_000_000)
+            if "Adaptive Sort" in names:
+                choice, _, reason = choose_algorithm(make_input(base, "python"))
+                notes.append(f"Adaptive Sort → {choice} ({reason})")
+            if count_ops:
+                for result in results:
+                    if runner.cancelled:
+                        return
+                    root.after(0, lambda n=result.name: status_var.set(f"Counting operations of {n}…"))
+                    sort_fn = dict(selected)[result.name]
+                    result.counts = count_operations(sort_fn, make_input(base, backend_of(sort_fn)))
+
+        if profile_mem:
+            for result in results:
+                if runner.cancelled:
+                    return
+                root.after(0, lambda n=result.name: status_var.set(f"Profiling memory of {n}…"))
+                try:
+                    result.memory = profile_memory(result.name, distribution, count, seed,
+                                                   lo=1, hi=1_000_000,
+                                                   timeout=max(PROFILE_TIMEOUT, timeout))
+                except RuntimeError as error:
+                    notes.append(str(error).splitlines()[0])
+
+    root.after(POLL_MS, poll)
 
 
 run_btn.configure(command=run_benchmark)
 
 
+def run_sweep():
+    """Run a scaling sweep for each selected algorithm, then plot it."""
+    selected = [(n, fn) for n, _, fn in ALGORITHMS if algo_vars[n].get()]
+    if not selected:
+        messagebox.showwarning("No Algorithm Selected",
+                               "Please select at least one sorting algorithm.")
+        return
+
+    try:
+        timeout = float(timeout_var.get())
+    except ValueError:
+        timeout = 0
+    if timeout <= 0:
+        messagebox.showwarning("Invalid Input",
+                               "The timeout must be a positive number of seconds.")
+        return
+
+    raw_seed = seed_var.get().strip()
+    seed = int(raw_seed) if raw_seed.isdigit() else 0
+    distribution = dist_var.get()
+
+    runner = JobRunner(pin=all(fn is not parallel_merge_sort for _, fn in selected)).start()
+    parallel = ParallelSweep([name for name, _ in selected],
+                             distribution=distribution, seed=seed, timeout=timeout)
+    parallel.start(runner)
+    set_running(runner)
+
+    def handle(result):
+        parallel.handle(result, runner)
+        status_var.set(f"Sweeping on {runner.workers} worker process(es)… "
+                       f"{result.job.name}: n = {result.job.n:,}")
+
+    def poll():
+        drain(runner, handle)
+        if not parallel.done:
+            root.after(POLL_MS, poll)
+            return
+        runner.close()
+        state = "cancelled" if runner.cancelled else "complete"
+        status_var.set(f"✓ Sweep {state} ({distribution}, seed {seed})")
+        set_running(None)
+        show_sweep([r for r in parallel.results if r.sizes])
+
+    root.after(POLL_MS, poll)
+
+
+sweep_btn.configure(command=run_sweep)
+
+
 # ──────────────────────────────────────────────
 # Footer
 # ──────────────────────────────────────────────
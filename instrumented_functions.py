@@ -0,0 +1,259 @@
+"""
+Operation-counting builds of the algorithms in algorithm_functions.py.
+
+Rather than adding counters (and an "is counting enabled?" branch) to the hot
+loops, this module parses the source of algorithm_functions.py, rewrites the
+syntax tree to report every counted operation to an OperationCounts object
+and compiles the result into a separate namespace. The normal functions are
+left untouched, so there is no overhead at all when counting is not used.
+
+What is counted:
+    comparisons  comparisons with an element access (arr[i] < pivot) on
+                 either side, and those made inside bisect_left/bisect_right
+                 (replaced by pure-Python versions that report each one);
+                 index, loop-bound and run-stack comparisons are ignored
+    moves        element writes: item assignment (a swap is two), elements
+                 copied by slice assignment, append(), extend() and reverse(),
+                 and the elements shifted by insert() and del arr[i]
+    allocations  new lists and arrays: list displays and comprehensions,
+                 slices, and list()/sorted()/array() calls
+    max_depth    deepest recursion of any single function
+
+Usage:
+    from instrumented_functions import count_operations
+    counts = count_operations(merge_sort, [38, 27, 43, 3, 9, 82, 10])
+    print(counts.comparisons, counts.moves, counts.allocations, counts.max_depth)
+"""
+import ast
+import copy
+import inspect
+from collections import Counter
+from dataclasses import dataclass, field
+
+import algorithm_functions
+
+
+@dataclass
+class OperationCounts:
+    """Counters filled in by an instrumented run."""
+    comparisons: int = 0
+    moves: int = 0
+    allocations: int = 0
+    max_depth: int = 0
+    depths: Counter = field(default_factory=Counter, repr=False)
+
+    # Hooks called from the rewritten code
+    def compared(self, result):
+        self.comparisons += 1
+        return result
+
+    def moved(self, count):
+        self.moves += count
+
+    def moved_one(self, value):
+        self.moves += 1
+        return value
+
+    def moved_many(self, values):
+        self.moves += len(values) if hasattr(values, "__len__") else 0
+        return values
+
+    def inserted(self, seq, index, value):
+        # The elements from index on shift right, then value is written
+        n = len(seq)
+        index = min(max(index + n if index < 0 else index, 0), n)
+        self.moves += n - index + 1
+        return value
+
+    def deleted(self, seq, index):
+        # The elements after index shift left
+        n = len(seq)
+        self.moves += n - (index + n if index < 0 else index) - 1
+
+    def allocated(self, value):
+        self.allocations += 1
+        return value
+
+    def enter(self, name):
+        self.depths[name] += 1
+        self.max_depth = max(self.max_depth, self.depths[name])
+
+    def leave(self, name):
+        self.depths[name] -= 1
+
+
+HOOKS = "_ops"
+ALLOCATING_CALLS = {"list", "sorted", "array"}
+COUNTED_SEARCHES = {"bisect_left": False, "bisect_right": True}   # name -> right
+BOOKKEEPING = {"runs"}   # stacks of (start, length) pairs, not elements
+
+
+def hook(name, *args):
+    """Build the AST for _ops.<name>(*args)."""
+    return ast.Call(
+        func=ast.Attribute(value=ast.Name(id=HOOKS, ctx=ast.Load()), attr=name, ctx=ast.Load()),
+        args=list(args), keywords=[],
+    )
+
+
+def is_slice(node):
+    return isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Slice)
+
+
+def is_element_access(node):
+    if not isinstance(node, ast.Subscript) or isinstance(node.slice, ast.Slice):
+        return False
+    while isinstance(node, ast.Subscript):
+        node = node.value
+    return not (isinstance(node, ast.Name) and node.id in BOOKKEEPING)
+
+
+class Instrumenter(ast.NodeTransformer):
+    """Rewrites a module so that every counted operation calls a hook."""
+
+    def visit_FunctionDef(self, node):
+        self.generic_visit(node)
+        name = ast.Constant(node.name)
+        node.body = [
+            ast.Expr(hook("enter", name)),
+            ast.Try(body=node.body, handlers=[], orelse=[],
+                    finalbody=[ast.Expr(hook("leave", name))]),
+        ]
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if any(is_element_access(operand) for operand in [node.left, *node.comparators]):
+            return hook("compared", node)
+        return node
+
+    def visit_Assign(self, node):
+        self.generic_visit(node)
+        if len(node.targets) == 1 and is_slice(node.targets[0]):
+            node.value = hook("moved_many", node.value)
+            return node
+        writes = sum(is_element_access(t) for target in node.targets for t in flatten(target))
+        if writes:
+            return [ast.Expr(hook("moved", ast.Constant(writes))), node]
+        return node
+
+    def visit_Delete(self, node):
+        self.generic_visit(node)
+        hooks = [ast.Expr(hook("deleted", copy.deepcopy(t.value), copy.deepcopy(t.slice)))
+                 for t in node.targets if is_element_access(t)]
+        return hooks + [node] if hooks else node
+
+    def visit_AugAssign(self, node):
+        self.generic_visit(node)
+        if is_element_access(node.target):
+            return [ast.Expr(hook("moved", ast.Constant(1))), node]
+        return node
+
+    def visit_Subscript(self, node):
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load) and isinstance(node.slice, ast.Slice):
+            return hook("allocated", node)
+        return node
+
+    def visit_List(self, node):
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load):
+            return hook("allocated", node)
+        return node
+
+    def visit_ListComp(self, node):
+        self.generic_visit(node)
+        return hook("allocated", node)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        func = node.func
+        if isinstance(func, ast.Name) and func.id in ALLOCATING_CALLS:
+            return hook("allocated", node)
+        if isinstance(func, ast.Attribute) and len(node.args) == 1:
+            if func.attr == "append":
+                node.args = [hook("moved_one", node.args[0])]
+            elif func.attr == "extend":
+                node.args = [hook("moved_many", node.args[0])]
+        if (isinstance(func, ast.Attribute) and func.attr == "insert" and len(node.args) == 2
+                and is_element_access(ast.Subscript(value=func.value, slice=node.args[0]))):
+            node.args[1] = hook("inserted", copy.deepcopy(func.value),
+                                copy.deepcopy(node.args[0]), node.args[1])
+        if isinstance(func, ast.Attribute) and func.attr == "reverse" and not node.args:
+            # n // 2 swaps, i.e. about one write per element
+            func.value = hook("moved_many", func.value)
+        return node
+
+
+def flatten(target):
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [t for element in target.elts for t in flatten(element)]
+    return [target]
+
+
+def counted_search(namespace, right):
+    """
+    A pure-Python bisect_right (or bisect_left) that reports every comparison
+    to the namespace's current OperationCounts. It probes the same positions
+    as the C version, so the count is what the C version would have made.
+    """
+    def search(a, x, lo=0, hi=None, *, key=None):
+        ops = namespace[HOOKS]
+        if hi is None:
+            hi = len(a)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = a[mid] if key is None else key(a[mid])
+            if ops.compared(x < probe if right else not probe < x):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+    return search
+
+
+_namespace = None
+
+
+def instrumented_namespace():
+    """Compile (once) and return the namespace of instrumented functions."""
+    global _namespace
+    if _namespace is None:
+        tree = Instrumenter().visit(ast.parse(inspect.getsource(algorithm_functions)))
+        ast.fix_missing_locations(tree)
+        namespace = {"__name__": "algorithm_functions_instrumented", HOOKS: OperationCounts()}
+        exec(compile(tree, "<instrumented algorithm_functions>", "exec"), namespace)
+        # The C searches compare out of the rewriter's reach; gallop() gets
+        # them passed in by name, so replacing the globals covers it too.
+        for name, right in COUNTED_SEARCHES.items():
+            if name in namespace:
+                namespace[name] = counted_search(namespace, right)
+        _namespace = namespace
+    return _namespace
+
+
+def count_operations(sort_fn, data, **kwargs):
+    """
+    Run the instrumented build of sort_fn on a copy of data and return its
+    OperationCounts, or None if sort_fn is not from algorithm_functions.py
+    (e.g. a NumPy variant).
+    """
+    if getattr(sort_fn, "__module__", None) != algorithm_functions.__name__:
+        return None
+    namespace = instrumented_namespace()
+    instrumented = namespace.get(sort_fn.__name__)
+    if instrumented is None:
+        return None
+
+    counts = OperationCounts()
+    namespace[HOOKS] = counts
+    instrumented(copy.copy(data), **kwargs)
+    return counts
+
+
+def format_count(value):
+    """Compact form for tables: 950, 12.3k, 4.56M, 1.2G."""
+    for limit, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if value >= limit:
+            return f"{value / limit:.3g}{suffix}"
+    return str(value)
@@ -0,0 +1,248 @@
+"""
+Process-isolated, parallel benchmark runs.
+
+A JobRunner keeps one worker subprocess per CPU (each pinned to its own core
+where the OS supports it) and hands out jobs, one timed run of one algorithm
+on one generated input each. Because every run happens in another process,
+the caller's thread (e.g. the Tk event loop) is never blocked by the GIL, a
+run that exceeds its timeout is stopped by killing its worker (a fresh one
+is started for the next job), and cancel() stops everything at once.
+Results arrive on the `results` queue in completion order.
+
+Workers load the seeded input themselves (from dataset_cache, so it is only
+generated once), so only small JSON messages cross the process boundary, and
+keep it between the repetitions of a job. Each timed run's output is
+verified (verification.py) after the clock stops; a wrong result is still
+"ok" but carries the reason in JobResult.invalid.
+
+Runs on different cores share caches and memory bandwidth, so timings are
+slightly noisier than sequential ones; pass workers=1 for the quietest
+numbers. Pinned workers also confine Parallel Merge Sort's own pool to one
+core, so use pin=False when benchmarking it.
+
+Usage:
+    runner = JobRunner()
+    runner.start()
+    for rep in range(5):
+        runner.submit(Job("Merge Sort", 100_000, seed=1, repetition=rep, timeout=30))
+    runner.close()
+    for _ in range(5):
+        print(runner.results.get())
+"""
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import traceback
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class Job:
+    """One timed run of one algorithm on one generated input."""
+    name: str
+    n: int
+    distribution: str = "uniform"
+    seed: int = 0
+    repetition: int = 0
+    lo: int = 1
+    hi: int = 1_000_000
+    timeout: float = None   # seconds for the whole job, warm-up included
+    warmup: bool = True     # discarded first run per worker and algorithm
+
+
+@dataclass
+class JobResult:
+    """Outcome of a Job: "ok", "timeout", "error", "skipped" or "cancelled"."""
+    job: Job
+    status: str
+    elapsed: float = None
+    cpu: int = None
+    error: str = ""
+    invalid: str = ""       # why the output failed verification, if it did
+
+
+def available_cpus():
+    """The CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+class JobRunner:
+    """A pool of pinned worker subprocesses fed from a job queue."""
+
+    def __init__(self, workers=None, pin=True):
+        self.cpus = available_cpus()
+        self.workers = workers or len(self.cpus)
+        self.pin = pin and hasattr(os, "sched_setaffinity")
+        self.results = queue.Queue()
+        self._jobs = queue.Queue()
+        self._cancelled = threading.Event()
+        self._skipped = set()
+        self._processes = {}
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        for slot in range(self.workers):
+            thread = threading.Thread(target=self._serve, args=(slot,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def submit(self, job):
+        self._jobs.put(job)
+
+    def close(self):
+        """No more jobs will be submitted; workers exit once the queue is empty."""
+        for _ in self._threads:
+            self._jobs.put(None)
+
+    def skip(self, name):
+        """Report the still-queued jobs of algorithm `name` as skipped."""
+        self._skipped.add(name)
+
+    def cancel(self):
+        """Kill the running jobs and report every queued job as cancelled."""
+        self._cancelled.set()
+        with self._lock:
+            for process in self._processes.values():
+                process.kill()
+        self.close()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def join(self, timeout=None):
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def _serve(self, slot):
+        cpu = self.cpus[slot % len(self.cpus)] if self.pin else None
+        process = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            if self.cancelled:
+                self.results.put(JobResult(job, "cancelled", cpu=cpu))
+                continue
+            if job.name in self._skipped:
+                self.results.put(JobResult(job, "skipped", cpu=cpu))
+                continue
+            if process is None:
+                process = WorkerProcess(cpu)
+                with self._lock:
+                    self._processes[slot] = process
+                if self.cancelled:
+                    process.kill()
+
+            result = process.run(job)
+            if result.status != "ok":
+                # A timed-out or crashed worker is replaced by a fresh one
+                process.kill()
+                process = None
+                if self.cancelled:
+                    result.status = "cancelled"
+            self.results.put(result)
+
+        if process is not None:
+            process.close()
+        with self._lock:
+            self._processes.pop(slot, None)
+
+
+class WorkerProcess:
+    """One child running serve(), driven over line-delimited JSON."""
+
+    def __init__(self, cpu=None):
+        self.cpu = cpu
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        if cpu is not None:
+            try:
+                os.sched_setaffinity(self.process.pid, {cpu})
+            except OSError:
+                self.cpu = None
+        # Replies are read on a separate thread so that waiting for one
+        # can time out portably (select() does not work on Windows pipes).
+        self.replies = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.replies.put(line)
+        self.replies.put(None)
+
+    def run(self, job):
+        try:
+            self.process.stdin.write(json.dumps(asdict(job)) + "\n")
+            self.process.stdin.flush()
+        except OSError:
+            return JobResult(job, "error", cpu=self.cpu, error="worker exited")
+        try:
+            reply = self.replies.get(timeout=job.timeout)
+        except queue.Empty:
+            return JobResult(job, "timeout", cpu=self.cpu)
+        if reply is None:
+            return JobResult(job, "error", cpu=self.cpu, error="worker exited")
+        return JobResult(job, cpu=self.cpu, **json.loads(reply))
+
+    def kill(self):
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+
+# ──────────────────────────────────────────────
+# Child process side
+# ──────────────────────────────────────────────
+def serve():
+    """Answer one JSON job per stdin line with one JSON reply on stdout."""
+    from algorithm_registry import find_algorithm, backend_of, make_input
+    from benchmark import time_once, run_once
+    from dataset_cache import generate_array
+    from verification import verify
+
+    values_key, values, inputs = None, None, {}
+    warmed = set()
+    for line in sys.stdin:
+        job = Job(**json.loads(line))
+        try:
+            sort_fn = find_algorithm(job.name)
+            key = (job.distribution, job.n, job.seed, job.lo, job.hi)
+            if key != values_key:
+                values_key, inputs = key, {}
+                values = generate_array(job.distribution, job.n, seed=job.seed, lo=job.lo, hi=job.hi)
+            backend = backend_of(sort_fn)
+            if backend not in inputs:
+                inputs[backend] = make_input(values, backend)
+            data = inputs[backend]
+
+            if job.warmup and (job.name, key) not in warmed:
+                time_once(sort_fn, data)
+                warmed.add((job.name, key))
+            elapsed, output = run_once(sort_fn, data)
+            reply = {"status": "ok", "elapsed": elapsed, "invalid": verify(data, output) or ""}
+        except Exception:
+            reply = {"status": "error", "error": traceback.format_exc()}
+        print(json.dumps(reply), flush=True)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    serve()
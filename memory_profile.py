@@ -0,0 +1,154 @@
+"""
+Memory profiling of the sorting algorithms.
+
+Each algorithm is profiled in its own fresh Python subprocess, so heap growth,
+allocator caches and garbage left behind by one run cannot inflate the next.
+The child regenerates the (seeded) input itself, then reports:
+
+    peak_rss     growth of the process's peak resident set size while sorting
+                 (Linux: VmHWM, reset before the run; elsewhere ru_maxrss)
+    traced_peak  peak bytes allocated by Python during the sort (tracemalloc)
+    allocations  list/array allocations counted by instrumented_functions
+                 (None for functions outside algorithm_functions.py)
+
+tracemalloc slows pure-Python sorts down roughly 25x, so callers should
+make profiling opt-in and pass a timeout (PROFILE_TIMEOUT by default in the
+CLI and GUI); a child that fails or times out raises RuntimeError.
+
+Usage:
+    from memory_profile import profile_memory
+    profile = profile_memory("Merge Sort", "uniform", 100_000, seed=1)
+    print(profile.traced_peak, profile.bytes_per_element)
+"""
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+
+PROFILE_TIMEOUT = 120  # seconds per algorithm in the CLI and GUI
+
+
+@dataclass
+class MemoryProfile:
+    """Memory used by one algorithm sorting n elements."""
+    name: str
+    n: int
+    peak_rss: int = None
+    traced_peak: int = None
+    allocations: int = None
+
+    @property
+    def bytes_per_element(self) -> float:
+        if not self.n or self.traced_peak is None:
+            return 0.0
+        return self.traced_peak / self.n
+
+
+def profile_memory(name, distribution, n, seed, lo=1, hi=1_000_000, timeout=None):
+    """Profile the named algorithm in a fresh subprocess; returns MemoryProfile."""
+    job = {"name": name, "distribution": distribution, "n": n,
+           "seed": seed, "lo": lo, "hi": hi}
+    try:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), json.dumps(job)],
+            capture_output=True, text=True, timeout=timeout,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"Memory profile of {name} timed out after {timeout:g} s") from None
+    if completed.returncode != 0:
+        raise RuntimeError(f"Memory profile of {name} failed:\n{completed.stderr}")
+    return MemoryProfile(**json.loads(completed.stdout))
+
+
+# ──────────────────────────────────────────────
+# Child process side
+# ──────────────────────────────────────────────
+def profile_in_this_process(name, distribution, n, seed, lo, hi):
+    """Measure one algorithm in the current (fresh) process."""
+    from algorithm_registry import find_algorithm, backend_of, make_input
+    from dataset_cache import generate_array
+    from instrumented_functions import count_operations
+
+    sort_fn = find_algorithm(name)
+    values = make_input(generate_array(distribution, n, seed=seed, lo=lo, hi=hi),
+                        backend_of(sort_fn))
+    profile = MemoryProfile(name, n)
+
+    # Peak RSS first, without tracemalloc's own bookkeeping in the way
+    data = values.copy()
+    gc.collect()
+    baseline = reset_peak_rss()
+    if baseline is not None:
+        sort_fn(data)
+        profile.peak_rss = max(read_peak_rss() - baseline, 0)
+    del data
+
+    data = values.copy()
+    gc.collect()
+    tracemalloc.start()
+    sort_fn(data)
+    profile.traced_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del data
+
+    counts = count_operations(sort_fn, values)
+    profile.allocations = counts.allocations if counts else None
+    return profile
+
+
+def reset_peak_rss():
+    """
+    Reset the peak-RSS counter where the OS allows it and return the value to
+    measure growth from, or None if peak RSS cannot be read at all.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return read_status_kb("VmRSS") * 1024
+    except OSError:
+        return read_peak_rss()
+
+
+def read_peak_rss():
+    """Peak resident set size of this process in bytes, or None."""
+    try:
+        return read_status_kb("VmHWM") * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def read_status_kb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise OSError(f"{field} not found in /proc/self/status")
+
+
+def format_bytes(n):
+    """Return a human‑friendly string for a byte count."""
+    if n is None:
+        return "–"
+    for unit in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.2f} GB"
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    result = profile_in_this_process(**json.loads(sys.argv[1]))
+    print(json.dumps(result.__dict__))
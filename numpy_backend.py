@@ -0,0 +1,213 @@
+"""
+NumPy implementations of the algorithms in algorithm_functions.py.
+
+Each function takes an int64/float64 ndarray (or anything np.asarray can turn
+into one), sorts it in place and returns it, mirroring the list versions.
+The algorithms are the same; only the per-element Python loops are replaced
+by whole-array operations.
+"""
+import numpy as np
+
+
+def as_buffer(arr):
+    """Return arr as an int64 or float64 ndarray, converting only if needed."""
+    if isinstance(arr, np.ndarray) and arr.dtype in (np.int64, np.float64):
+        return arr
+    buf = np.asarray(arr)
+    if buf.dtype.kind in "iub" or buf.size == 0:
+        return buf.astype(np.int64)
+    return buf.astype(np.float64)
+
+
+def max_value(dtype):
+    if dtype.kind == "f":
+        return np.inf
+    return np.iinfo(dtype).max
+
+
+# ──────────────────────────────────────────────
+# O(n²) sorts
+# ──────────────────────────────────────────────
+def selection_sort(arr):
+    """Selection sort with each minimum-search pass done by argmin."""
+    a = as_buffer(arr)
+    n = len(a)
+    for i in range(n - 1):
+        min_index = i + int(np.argmin(a[i:]))
+        if min_index != i:
+            a[i], a[min_index] = a[min_index], a[i]
+    return a
+
+
+def bubble_sort(arr):
+    """
+    Bubble sort as odd-even transposition: every pass compare-swaps all
+    disjoint neighbouring pairs at once. Stops after two passes without a
+    swap.
+    """
+    a = as_buffer(arr)
+    odd_even_passes(a, len(a))
+    return a
+
+
+def odd_even_passes(a, passes):
+    """Run up to `passes` odd-even transposition passes over a, in place."""
+    n = len(a)
+    quiet_passes = 0
+    for p in range(passes):
+        left = a[p % 2:n - 1:2]
+        right = a[p % 2 + 1:n:2]
+        if (left > right).any():
+            lo = np.minimum(left, right)
+            right[...] = np.maximum(left, right)
+            left[...] = lo
+            quiet_passes = 0
+        else:
+            quiet_passes += 1
+            if quiet_passes == 2:
+                break
+
+
+# ──────────────────────────────────────────────
+# Merge Sort
+# ──────────────────────────────────────────────
+BLOCK_SIZE = 32
+
+
+def merge_sort(arr):
+    """
+    Bottom-up merge sort. Blocks of BLOCK_SIZE elements are sorted together
+    by odd-even transposition on a (blocks, BLOCK_SIZE) view, then merged
+    pairwise with searchsorted-based vectorized merges.
+    """
+    a = as_buffer(arr)
+    n = len(a)
+    if n <= 1:
+        return a
+
+    # Pad to a whole number of blocks with the dtype's maximum, which sorts
+    # to the end and is dropped afterwards.
+    padded = -(-n // BLOCK_SIZE) * BLOCK_SIZE
+    src = np.full(padded, max_value(a.dtype), dtype=a.dtype)
+    src[:n] = a
+    blocks = src.reshape(-1, BLOCK_SIZE)
+    for p in range(BLOCK_SIZE):
+        left = blocks[:, p % 2:BLOCK_SIZE - 1:2]
+        right = blocks[:, p % 2 + 1:BLOCK_SIZE:2]
+        lo = np.minimum(left, right)
+        right[...] = np.maximum(left, right)
+        left[...] = lo
+
+    dst = np.empty_like(src)
+    width = BLOCK_SIZE
+    while width < padded:
+        for lo in range(0, padded, 2 * width):
+            mid = min(lo + width, padded)
+            hi = min(lo + 2 * width, padded)
+            merge_into(src[lo:mid], src[mid:hi], dst[lo:hi])
+        src, dst = dst, src
+        width *= 2
+
+    a[:] = src[:n]
+    return a
+
+
+def merge_into(left, right, out):
+    """Stable merge of two sorted arrays into out (len(left) + len(right))."""
+    if len(right) == 0 or left[-1] <= right[0]:
+        out[:len(left)] = left
+        out[len(left):] = right
+        return
+    # Each element's final index is its own index plus the number of
+    # elements from the other run that precede it.
+    out[np.arange(len(left)) + np.searchsorted(right, left, side="left")] = left
+    out[np.arange(len(right)) + np.searchsorted(left, right, side="right")] = right
+
+
+# ──────────────────────────────────────────────
+# Quick Sort
+# ──────────────────────────────────────────────
+SMALL_SEGMENT = 16
+
+
+def quick_sort(arr):
+    """
+    Quick sort with vectorized three-way partitioning. Segments are kept on
+    an explicit stack, so there is no recursion at all.
+
+    Segments of at most SMALL_SEGMENT elements are left unsorted and finished
+    together by SMALL_SEGMENT odd-even transposition passes over the whole
+    array: every element of a segment is <= every element of the next one,
+    so no swap ever crosses a segment boundary.
+    """
+    a = as_buffer(arr)
+    stack = [(0, len(a))]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo <= SMALL_SEGMENT:
+            continue
+        seg = a[lo:hi]
+        x, y, z = seg[0], seg[(hi - lo) // 2], seg[-1]
+        pivot = max(min(x, y), min(max(x, y), z))
+
+        less = seg[seg < pivot]
+        greater = seg[seg > pivot]
+        lt = lo + len(less)
+        gt = hi - len(greater)
+
+        a[lo:lt] = less
+        a[lt:gt] = pivot
+        a[gt:hi] = greater
+
+        stack.append((lo, lt))
+        stack.append((gt, hi))
+
+    odd_even_passes(a, SMALL_SEGMENT)
+    return a
+
+
+# ──────────────────────────────────────────────
+# Non-comparison sorts (integer keys)
+# ──────────────────────────────────────────────
+def as_int_buffer(arr):
+    a = as_buffer(arr)
+    if a.dtype.kind != "i" and len(a):  # np.array([]) is float64
+        raise TypeError("counting and radix sort need integer input")
+    return a
+
+
+def counting_sort(arr):
+    """Counting sort via bincount over the offset keys."""
+    a = as_int_buffer(arr)
+    if len(a) <= 1:
+        return a
+    lo = a.min()
+    counts = np.bincount(a - lo)
+    a[:] = np.repeat(np.arange(lo, lo + len(counts), dtype=a.dtype), counts)
+    return a
+
+
+def radix_sort(arr, radix=256):
+    """
+    LSD radix sort. Each pass extracts one base-radix digit per key and
+    reorders the keys by a stable argsort of those digits; for uint8/uint16
+    digits NumPy's stable sort is itself a counting sort.
+    """
+    if radix < 2:
+        raise ValueError("radix must be at least 2")
+    a = as_int_buffer(arr)
+    if len(a) <= 1:
+        return a
+
+    lo = a.min()
+    keys = (a - lo).astype(np.uint64)
+    digit_dtype = np.uint8 if radix <= 1 << 8 else np.uint16 if radix <= 1 << 16 else np.uint64
+    max_key = int(keys.max())
+    exp = 1
+    while exp <= max_key:
+        digits = (keys // np.uint64(exp) % np.uint64(radix)).astype(digit_dtype)
+        keys = keys[np.argsort(digits, kind="stable")]
+        exp *= radix
+
+    a[:] = keys.astype(np.int64) + lo
+    return a
@@ -0,0 +1,226 @@
+"""
+Persistent benchmark results with regression detection.
+
+Every Measurement can be saved into a local SQLite database together with
+what it was measured on: algorithm, backend, input size, distribution and
+seed, the code version (git describe, "-dirty" for uncommitted changes) and
+a fingerprint of the host. compare() then tests each (algorithm, backend,
+size, distribution) of a candidate version against a baseline version on
+the same host with Welch's t-test and flags the significant slowdowns.
+
+Usage:
+    python result_store.py list
+    python result_store.py compare                    # latest vs. the one before
+    python result_store.py compare --baseline 1a2b3c --candidate 4d5e6f
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from benchmark import format_time, t_cdf
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DB = os.path.join(HERE, "benchmark_results.sqlite")
+ALPHA = 0.05           # significance level of the one-sided test
+MIN_SLOWDOWN = 0.05    # ignore significant but tiny (< 5%) slowdowns
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    id           INTEGER PRIMARY KEY,
+    created      TEXT NOT NULL,
+    version      TEXT NOT NULL,
+    host         TEXT NOT NULL,
+    algorithm    TEXT NOT NULL,
+    backend      TEXT NOT NULL,
+    n            INTEGER NOT NULL,
+    distribution TEXT NOT NULL,
+    seed         INTEGER,
+    times        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS measurements_key
+    ON measurements (host, algorithm, backend, n, distribution, version);
+"""
+
+
+@dataclass
+class Comparison:
+    """One (algorithm, backend, size, distribution) in baseline and candidate."""
+    algorithm: str
+    backend: str
+    n: int
+    distribution: str
+    baseline_mean: float
+    candidate_mean: float
+    p_value: float
+
+    @property
+    def change(self) -> float:
+        """Relative change of the mean time; +0.10 is 10% slower."""
+        return self.candidate_mean / self.baseline_mean - 1
+
+    @property
+    def regression(self) -> bool:
+        return self.p_value < ALPHA and self.change > MIN_SLOWDOWN
+
+
+def code_version():
+    """`git describe --always --dirty` of this tree, or "unknown"."""
+    try:
+        completed = subprocess.run(["git", "describe", "--always", "--dirty"],
+                                   cwd=HERE, capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return "unknown"
+    return completed.stdout.strip() or "unknown"
+
+
+def host_fingerprint():
+    """Short hash of the machine and interpreter the numbers depend on."""
+    cpu = platform.processor()
+    try:
+        with open("/proc/cpuinfo") as f:
+            cpu = next((line.split(":", 1)[1].strip() for line in f
+                        if line.startswith("model name")), cpu)
+    except OSError:
+        pass
+    parts = [platform.node(), platform.machine(), cpu, str(os.cpu_count()),
+             platform.python_implementation(), platform.python_version()]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+class ResultStore:
+    """Benchmark results in one SQLite file."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.version = code_version()
+        self.host = host_fingerprint()
+        with self.connect() as db:
+            db.executescript(SCHEMA)
+
+    def connect(self):
+        return sqlite3.connect(self.path)
+
+    def save(self, measurement, backend, n, distribution, seed=None):
+        """Store one benchmark.Measurement under the current version and host."""
+        with self.connect() as db:
+            db.execute(
+                "INSERT INTO measurements (created, version, host, algorithm, backend,"
+                " n, distribution, seed, times) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (datetime.datetime.now().isoformat(timespec="seconds"), self.version,
+                 self.host, measurement.name, backend, n, distribution, seed,
+                 json.dumps(measurement.times)),
+            )
+
+    def versions(self, host=None):
+        """(version, first saved, rows) for a host, oldest first."""
+        with self.connect() as db:
+            return db.execute(
+                "SELECT version, MIN(created), COUNT(*) FROM measurements"
+                " WHERE host = ? GROUP BY version ORDER BY MIN(created)",
+                (host or self.host,),
+            ).fetchall()
+
+    def find_version(self, prefix, host=None):
+        """The stored version starting with prefix (most recent if several)."""
+        matches = [v for v, _, _ in self.versions(host) if v.startswith(prefix)]
+        if not matches:
+            raise KeyError(f"No results stored for version {prefix!r}")
+        return matches[-1]
+
+    def times(self, version, host=None):
+        """{(algorithm, backend, n, distribution): [all times]} of a version."""
+        pooled = {}
+        with self.connect() as db:
+            rows = db.execute(
+                "SELECT algorithm, backend, n, distribution, times FROM measurements"
+                " WHERE host = ? AND version = ?",
+                (host or self.host, version),
+            )
+            for algorithm, backend, n, distribution, times in rows:
+                pooled.setdefault((algorithm, backend, n, distribution), []).extend(json.loads(times))
+        return pooled
+
+    def compare(self, baseline=None, candidate=None, host=None):
+        """
+        Compare two stored versions (prefixes allowed); by default the latest
+        version against the one before it. Returns a list of Comparison for
+        every configuration measured (at least twice) in both.
+        """
+        stored = [v for v, _, _ in self.versions(host)]
+        candidate = self.find_version(candidate, host) if candidate else (stored or [None])[-1]
+        if baseline:
+            baseline = self.find_version(baseline, host)
+        else:
+            earlier = [v for v in stored if v != candidate]
+            baseline = earlier[-1] if earlier else None
+        if baseline is None or candidate is None:
+            raise KeyError("Need results for two versions to compare")
+
+        old, new = self.times(baseline, host), self.times(candidate, host)
+        comparisons = []
+        for key in sorted(old.keys() & new.keys()):
+            if len(old[key]) < 2 or len(new[key]) < 2:
+                continue
+            comparisons.append(Comparison(*key, statistics.fmean(old[key]),
+                                          statistics.fmean(new[key]),
+                                          welch_p_value(old[key], new[key])))
+        return baseline, candidate, comparisons
+
+
+def welch_p_value(baseline, candidate):
+    """One-sided p-value of Welch's t-test for "candidate is slower"."""
+    n1, n2 = len(baseline), len(candidate)
+    v1 = statistics.variance(baseline) / n1
+    v2 = statistics.variance(candidate) / n2
+    diff = statistics.fmean(candidate) - statistics.fmean(baseline)
+    if v1 + v2 == 0:
+        return 0.0 if diff > 0 else 1.0
+    t = diff / math.sqrt(v1 + v2)
+    df = (v1 + v2) ** 2 / (v1 ** 2 / (n1 - 1) + v2 ** 2 / (n2 - 1))
+    return 1 - t_cdf(t, df)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect stored benchmark results.")
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite file (default %(default)s)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the versions stored for this host")
+    compare = commands.add_parser("compare", help="flag slowdowns against a baseline")
+    compare.add_argument("--baseline", help="version (prefix) to compare against")
+    compare.add_argument("--candidate", help="version (prefix) to check (default latest)")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.db)
+    if args.command == "list":
+        for version, created, rows in store.versions():
+            print(f"{version:<24} {created}  {rows} measurement(s)")
+        return 0
+
+    try:
+        baseline, candidate, comparisons = store.compare(args.baseline, args.candidate)
+    except KeyError as error:
+        print(f"error: {error.args[0]}", file=sys.stderr)
+        return 2
+    print(f"Baseline {baseline}  vs.  candidate {candidate}  (host {store.host})")
+    for c in comparisons:
+        flag = "   <-- REGRESSION" if c.regression else ""
+        print(f"{c.algorithm:<26} {c.backend:<7} {c.distribution:<16} n = {c.n:>10,}  "
+              f"{format_time(c.baseline_mean):>10} → {format_time(c.candidate_mean):>10}  "
+              f"{c.change:+7.1%}  p = {c.p_value:.3f}{flag}")
+    regressions = sum(c.regression for c in comparisons)
+    print(f"{len(comparisons)} configuration(s) compared, {regressions} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
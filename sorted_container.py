@@ -0,0 +1,205 @@
+"""
+A list that stays sorted as values are added.
+
+SortedList keeps its values in a list of sorted chunks of roughly `load`
+values each, plus the maximum of every chunk. add() finds the chunk with a
+bisect over those maxima and inserts with another bisect. update() sorts the
+new batch with merge_sort and merges each slice of it into the chunk it
+belongs to with merge() (or bisect-inserts it when the slice is small), so
+appending a batch of m values costs about O(m log m + touched chunks * load)
+instead of re-sorting all n values.
+
+Equal values keep insertion order: a new value goes after the equal values
+already present.
+
+Run this file directly to compare per-batch costs with re-sorting a list:
+    python sorted_container.py 1000 10000
+"""
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right, insort_right
+
+from algorithm_functions import merge, merge_sort
+
+
+DEFAULT_LOAD = 1000
+
+
+class SortedList:
+    """Sorted sequence with O(log n) add and batch-proportional update()."""
+
+    def __init__(self, iterable=(), load=DEFAULT_LOAD):
+        self._load = load
+        self._lists = []
+        self._maxes = []
+        self._len = 0
+        self.update(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._lists:
+            yield from chunk
+
+    def __contains__(self, value):
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        chunk = self._lists[i]
+        pos = bisect_left(chunk, value)
+        return chunk[pos] == value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        for chunk in self._lists:
+            if index < len(chunk):
+                return chunk[index]
+            index -= len(chunk)
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    def add(self, value):
+        """Insert one value after any equal values already present."""
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            i = bisect_right(self._maxes, value)
+            if i == len(self._maxes):
+                i -= 1
+                self._lists[i].append(value)
+                self._maxes[i] = value
+            else:
+                insort_right(self._lists[i], value)
+            self._split(i)
+        self._len += 1
+
+    def update(self, values):
+        """Add a batch: sort it, then merge each slice into its chunk."""
+        batch = merge_sort(list(values))
+        if not batch:
+            return
+        if len(batch) >= self._len // 2:
+            # Large batch: one linear merge and a rebuild is cheapest.
+            merged = merge(list(self), batch)
+            self._lists = [merged[i:i + self._load] for i in range(0, len(merged), self._load)]
+            self._maxes = [chunk[-1] for chunk in self._lists]
+            self._len = len(merged)
+            return
+
+        touched = []
+        last = len(self._maxes) - 1
+        j = 0
+        while j < len(batch):
+            # Values below a chunk's maximum belong in that chunk; values
+            # equal to it go after it, like add() does.
+            i = min(bisect_right(self._maxes, batch[j]), last)
+            end = len(batch) if i == last else bisect_left(batch, self._maxes[i], j)
+            chunk = self._lists[i]
+            if (end - j) * 8 < len(chunk):
+                # A few values: bisect + memmove beats a Python-level merge
+                for value in batch[j:end]:
+                    insort_right(chunk, value)
+            else:
+                # Only the tail from the first new value onwards is merged
+                start = bisect_right(chunk, batch[j])
+                chunk[start:] = merge(chunk[start:], batch[j:end])
+            self._maxes[i] = chunk[-1]
+            touched.append(i)
+            j = end
+        self._len += len(batch)
+        for i in reversed(touched):
+            self._split(i)
+
+    def discard(self, value):
+        """Remove one occurrence of value if present."""
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        chunk = self._lists[i]
+        pos = bisect_left(chunk, value)
+        if chunk[pos] != value:
+            return False
+        del chunk[pos]
+        self._len -= 1
+        if chunk:
+            self._maxes[i] = chunk[-1]
+        else:
+            del self._lists[i]
+            del self._maxes[i]
+        return True
+
+    def remove(self, value):
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def bisect_left(self, value):
+        """Index of the first value >= value."""
+        return self._position(value, bisect_left)
+
+    def bisect_right(self, value):
+        """Index just past the last value <= value."""
+        return self._position(value, bisect_right)
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Yield the values between lo and hi (None means unbounded)."""
+        if lo is None:
+            i, pos = 0, 0
+        else:
+            find = bisect_left if inclusive[0] else bisect_right
+            i = find(self._maxes, lo)
+            pos = find(self._lists[i], lo) if i < len(self._lists) else 0
+        for chunk in self._lists[i:]:
+            for value in chunk[pos:]:
+                if hi is not None and (hi < value or (value == hi and not inclusive[1])):
+                    return
+                yield value
+            pos = 0
+
+    def _position(self, value, find):
+        i = find(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return sum(len(chunk) for chunk in self._lists[:i]) + find(self._lists[i], value)
+
+    def _split(self, i):
+        chunk = self._lists[i]
+        if len(chunk) > 2 * self._load:
+            pieces = [chunk[k:k + self._load] for k in range(0, len(chunk), self._load)]
+            self._lists[i:i + 1] = pieces
+            self._maxes[i:i + 1] = [piece[-1] for piece in pieces]
+
+
+def report_batches(batch_sizes, batches=50):
+    """Print the cost of appending batches as the total grows."""
+    for m in batch_sizes:
+        print(f"\nbatch size {m:,}")
+        print(f"{'total n':>12} {'update()':>11} {'re-sort':>11}")
+        container = SortedList()
+        plain = []
+        for b in range(1, batches + 1):
+            batch = [random.randint(1, 1_000_000) for _ in range(m)]
+
+            start = time.perf_counter()
+            container.update(batch)
+            updated = time.perf_counter() - start
+
+            start = time.perf_counter()
+            plain.extend(batch)
+            merge_sort(plain)
+            resorted = time.perf_counter() - start
+
+            if b == 1 or b % 10 == 0:
+                print(f"{len(container):>12,} {updated * 1000:>9.2f}ms {resorted * 1000:>9.2f}ms")
+
+
+if __name__ == "__main__":
+    report_batches([int(arg) for arg in sys.argv[1:]] or [1_000, 10_000])
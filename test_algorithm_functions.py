@@ -0,0 +1,63 @@
+"""
+Stability of key= and reverse= across the registered sorts.
+
+Every pure-Python sort accepts key= and reverse= and must keep records with
+equal keys in their input order, as sorted() does (for reverse=True too).
+The sorts in STABLE_SORTS must also do so without a key, on records that
+compare by key alone.
+
+Run with:
+    python -m pytest -q
+"""
+import random
+from array import array
+from operator import itemgetter
+
+import pytest
+
+from algorithm_registry import ALGORITHMS, STABLE_SORTS
+from verification import Record
+
+SORTS = [pytest.param(fn, id=name) for name, _, fn in ALGORITHMS]
+
+
+def sort_copy(sort_fn, values, **kwargs):
+    data = values[:]
+    output = sort_fn(data, **kwargs)
+    return data if output is None else output
+
+
+def records(n=300, spread=8, seed=0):
+    """(key, position) pairs with many duplicate keys, negative ones included."""
+    rng = random.Random(seed)
+    return [(rng.randint(-spread, spread), i) for i in range(n)]
+
+
+@pytest.mark.parametrize("reverse", [False, True], ids=["ascending", "reverse"])
+@pytest.mark.parametrize("sort_fn", SORTS)
+def test_key_sort_is_stable(sort_fn, reverse):
+    data = records()
+    expected = sorted(data, key=itemgetter(0), reverse=reverse)
+    assert sort_copy(sort_fn, data, key=itemgetter(0), reverse=reverse) == expected
+
+
+@pytest.mark.parametrize("sort_fn", SORTS)
+def test_reverse_without_key(sort_fn):
+    data = [key for key, _ in records()]
+    assert sort_copy(sort_fn, data, reverse=True) == sorted(data, reverse=True)
+
+
+@pytest.mark.parametrize("sort_fn", [pytest.param(fn, id=name) for name, _, fn in ALGORITHMS
+                                     if fn in STABLE_SORTS])
+def test_stable_sort_keeps_equal_records_in_order(sort_fn):
+    data = [Record(key, i) for key, i in records()]
+    output = sort_copy(sort_fn, data)
+    assert [(r.value, r.index) for r in output] == sorted((r.value, r.index) for r in data)
+
+
+@pytest.mark.parametrize("sort_fn", SORTS)
+def test_key_sort_of_typed_array(sort_fn):
+    data = array("q", [key for key, _ in records()])
+    output = sort_copy(sort_fn, data, key=abs, reverse=True)
+    assert isinstance(output, array)
+    assert list(output) == sorted(data, key=abs, reverse=True)
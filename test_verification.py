@@ -0,0 +1,52 @@
+"""
+verify() must reject outputs that are sorted but not a permutation of the
+input. Every registered sort is correct, so the fuzzer cannot exercise these
+paths; the broken outputs are written out by hand.
+
+Run with:
+    python -m pytest -q
+"""
+import pytest
+
+from verification import Record, verify
+
+
+@pytest.mark.parametrize("original, output", [
+    ([1, 2, 3], [2, 2, 2]),                  # same count and sum
+    ([3, 1, 4, 1, 5], [1, 2, 2, 4, 5]),      # one value duplicated, two dropped
+    ([-1, 5], [-2, 5]),                      # hash(-1) == hash(-2)
+    ([3, -1], [-2, 3]),
+    ([0.5, 2.0], [1.0, 1.5]),
+], ids=["equal-sum", "duplicated", "hash-collision", "hash-collision-reordered", "floats"])
+def test_corrupted_values_are_rejected(original, output):
+    assert verify(original, output) == "output is not a permutation of the input"
+
+
+def test_corrupted_records_are_rejected():
+    original = [Record(-1, 0), Record(5, 1)]
+    output = [Record(-2, 0), Record(5, 1)]
+    assert verify(original, output, key=lambda r: r.value, stable=True) is not None
+
+
+def test_corrupted_tuples_are_rejected():
+    original = [(-1, 0), (5, 1)]
+    output = [(-2, 0), (5, 1)]
+    assert verify(original, output, key=lambda r: r[0], stable=True) is not None
+
+
+@pytest.mark.parametrize("original", [
+    [], [7], [3, -1, 2, -1, 0], [2.5, -0.0, 1, 1.0], [10 ** 30, -10 ** 30, 0],
+])
+def test_sorted_permutations_pass(original):
+    assert verify(original, sorted(original)) is None
+
+
+def test_out_of_order_output_is_rejected():
+    assert verify([2, 1, 3], [2, 1, 3]) == "out of order at index 1"
+
+
+def test_unstable_output_is_rejected():
+    original = [(1, "a"), (0, "b"), (1, "c")]
+    output = [original[1], original[2], original[0]]
+    assert verify(original, output, key=lambda r: r[0], stable=True) == \
+        "equal keys reordered at index 2"
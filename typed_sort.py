@@ -0,0 +1,116 @@
+"""
+In-place sorting of typed buffers.
+
+A list of n ints holds n pointers to int objects of 28-32 bytes each, and
+every comparison follows two of them. sort_buffer() instead sorts an
+array.array ('q', 'd', ...), a bytearray, a NumPy array or any other
+writable one-dimensional buffer in place through a memoryview. Values are
+unboxed one at a time as they are compared, and the scratch space of
+merge_sort, tim_sort and radix_sort is a typed buffer too (see
+algorithm_functions.scratch), so the data never lives in a list.
+
+Only the sorts in BUFFER_SORTS work this way; the others build lists
+internally and are refused.
+
+Run this file directly to compare memory per element and throughput with
+sorting a list:
+    python typed_sort.py                  # n = 100,000 and 1,000,000
+    python typed_sort.py 200000 --distribution nearly_sorted
+"""
+import argparse
+import sys
+import tracemalloc
+from functools import partial
+
+from algorithm_functions import (selection_sort, bubble_sort, optimized_bubble_sort,
+                                 cocktail_shaker_sort, shell_sort, shell_sort_tokuda,
+                                 comb_sort, merge_sort, tim_sort, quick_sort, radix_sort)
+from benchmark import format_time, measure
+from dataset_cache import generate_array, generate_buffer
+from memory_profile import format_bytes
+
+
+BUFFER_SORTS = (selection_sort, bubble_sort, optimized_bubble_sort, cocktail_shaker_sort,
+                shell_sort, shell_sort_tokuda, comb_sort, merge_sort, tim_sort, quick_sort,
+                radix_sort)
+INTEGER_FORMATS = "bBhHiIlLqQnN"
+NUMERIC_FORMATS = INTEGER_FORMATS + "fd"
+
+
+def typed_view(buffer):
+    """Return a writable, one-dimensional memoryview of buffer in its native item type."""
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TypeError("cannot sort a read-only buffer in place")
+    if view.ndim != 1 or not view.c_contiguous:
+        raise ValueError("only one-dimensional contiguous buffers can be sorted")
+    fmt = view.format.lstrip("@")
+    if fmt not in NUMERIC_FORMATS:
+        raise ValueError(f"unsupported item format {view.format!r}; "
+                         "expected native integers or floats")
+    return view if fmt == view.format else view.cast("B").cast(fmt)
+
+
+def sort_buffer(buffer, sort_fn=quick_sort):
+    """
+    Sort buffer in place with sort_fn, through a memoryview, and return it.
+
+    Parameters
+    ----------
+    buffer  : array.array, bytearray, NumPy array or other writable buffer
+    sort_fn : one of BUFFER_SORTS (radix_sort needs integer items)
+    """
+    if sort_fn not in BUFFER_SORTS:
+        raise ValueError(f"{sort_fn.__name__} builds lists internally; use one of "
+                         f"{', '.join(fn.__name__ for fn in BUFFER_SORTS)}")
+    view = typed_view(buffer)
+    if sort_fn is radix_sort and view.format not in INTEGER_FORMATS:
+        raise ValueError("radix_sort needs integer items")
+    sort_fn(view)
+    return buffer
+
+
+def container_bytes(values):
+    """Approximate bytes held by a list of ints (pointers + objects) or an array."""
+    if isinstance(values, list):
+        return sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+    return sys.getsizeof(values)
+
+
+def peak_bytes(sort_fn, data):
+    """Peak Python allocation while sort_fn sorts a copy of data."""
+    sample = data.copy() if hasattr(data, "copy") else data[:]
+    tracemalloc.start()
+    try:
+        sort_fn(sample)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def report(sizes, distribution="uniform", sorts=(quick_sort, merge_sort, tim_sort, radix_sort),
+           repeats=3):
+    """Print bytes per element and throughput of list and typed-buffer sorting."""
+    for n in sizes:
+        as_list = generate_array(distribution, n, seed=0).tolist()
+        as_array = generate_buffer(distribution, n, seed=0)
+        print(f"\nn = {n:,} ({distribution})")
+        print(f"  input      list {container_bytes(as_list) / n:6.1f} B/elem"
+              f"   array('q') {container_bytes(as_array) / n:6.1f} B/elem")
+        print(f"  {'':<20} {'median':>10} {'Melem/s':>8} {'peak extra':>11}")
+        for sort_fn in sorts:
+            entries = [(f"{sort_fn.__name__} list", sort_fn, as_list),
+                       (f"{sort_fn.__name__} typed", partial(sort_buffer, sort_fn=sort_fn), as_array)]
+            results = measure(entries, repeats=repeats, warmup=1)
+            for (_, fn, data), result in zip(entries, results):
+                print(f"  {result.name:<20} {format_time(result.median):>10}"
+                      f" {n / result.median / 1e6:>8.2f} {format_bytes(peak_bytes(fn, data)):>11}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare sorting typed buffers with sorting lists.")
+    parser.add_argument("sizes", nargs="*", type=int, default=[100_000, 1_000_000])
+    parser.add_argument("--distribution", default="uniform")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    report(args.sizes, args.distribution, repeats=args.repeats)
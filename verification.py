@@ -0,0 +1,196 @@
+"""
+Output verification and fuzzing for the sorting algorithms.
+
+verify() checks one sort's output in O(n), outside any timed region. The
+output must have the input's length and be in non-decreasing order (by key,
+if given). It must also be a permutation of the input: the multiset
+checksums of input and output must match. With stable=True and a key, equal
+keys must keep the input order. benchmark.measure() calls it after every
+run when given verify=verify. The CLI, basic_cli and the GUI's workers mark
+a result invalid when it fails, instead of letting a fast but broken sort
+win.
+
+fuzz() runs every registered algorithm on random and adversarial inputs
+(every distribution, tiny sizes, negative and repeated values, killer
+sequences) and verifies each output. Stable sorts get a record workload as
+well, with both key= and records that compare by key only. The exit status
+is 1 if anything failed.
+
+Usage:
+    python verification.py                         # fuzz everything
+    python verification.py --trials 200 --max-n 5000 "Tim Sort" "Quick Sort"
+"""
+import argparse
+import random
+import struct
+import sys
+from functools import partial, total_ordering
+from operator import itemgetter
+
+from algorithm_registry import (ALGORITHMS, STABLE_SORTS, numpy_algorithms, backend_of,
+                                make_input)
+from data_generators import DISTRIBUTIONS, generate_array
+
+
+MASK = (1 << 64) - 1
+
+
+def mix(h):
+    """splitmix64 finalizer: a nonlinear bijection of 64-bit integers."""
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK
+    return h ^ (h >> 31)
+
+
+def fingerprint(x):
+    """
+    64-bit fingerprint of one value. Numbers are taken by value, since
+    hash() collides on purpose (hash(-1) == hash(-2)); whole floats match
+    the equal int and other floats use their IEEE bits. Tuples and Records
+    are fingerprinted through their fields, for the same reason. Anything
+    else falls back to hash().
+    """
+    if isinstance(x, int):
+        return x & MASK
+    if isinstance(x, float):
+        if x.is_integer():
+            return int(x) & MASK
+        return struct.unpack("<Q", struct.pack("<d", x))[0]
+    if isinstance(x, Record):
+        return fingerprint(x.value)
+    if isinstance(x, tuple):
+        h = len(x)
+        for field in x:
+            h = mix(h ^ fingerprint(field))
+        return h
+    return hash(x) & MASK
+
+
+def checksum(values):
+    """
+    Order-independent fingerprint of a multiset: the count, the sum of the
+    fingerprints and the sum of their mixed values. A plain second sum of
+    h * constant would only repeat the first, so [1, 2, 3] and [2, 2, 2]
+    would match; mixing first makes equal totals from different values
+    collide only by chance.
+    """
+    prints = [x & MASK if type(x) is int else fingerprint(x) for x in values]
+    return len(prints), sum(prints) & MASK, sum(map(mix, prints)) & MASK
+
+
+def as_sequence(values):
+    """Plain Python values of a list, array, memoryview or ndarray."""
+    return values.tolist() if hasattr(values, "tolist") else values
+
+
+def verify(original, output, key=None, stable=False):
+    """
+    Return None if output is original sorted (stably, if requested), else
+    a short reason. Runs in O(n) time.
+    """
+    original, output = as_sequence(original), as_sequence(output)
+    n = len(original)
+    if len(output) != n:
+        return f"output has {len(output):,} values, input had {n:,}"
+
+    keys = output if key is None else [key(x) for x in output]
+    for i in range(1, n):
+        if keys[i] < keys[i - 1]:
+            return f"out of order at index {i:,}"
+
+    if checksum(original) != checksum(output):
+        return "output is not a permutation of the input"
+
+    if stable and key is not None:
+        position = {id(x): i for i, x in enumerate(original)}
+        for i in range(1, n):
+            if not keys[i - 1] < keys[i] and position[id(output[i])] < position[id(output[i - 1])]:
+                return f"equal keys reordered at index {i:,}"
+    return None
+
+
+@total_ordering
+class Record:
+    """A value tagged with its input position that compares by value only."""
+    __slots__ = ("value", "index")
+
+    def __init__(self, value, index):
+        self.value = value
+        self.index = index
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"Record({self.value!r}, {self.index})"
+
+
+def fuzz_cases(trials, max_n, rng):
+    """Yield (description, values) inputs, adversarial ones first."""
+    for n in (0, 1, 2, 3):
+        yield f"n={n}", [rng.randint(-5, 5) for _ in range(n)]
+    for distribution in DISTRIBUTIONS:
+        n = rng.randint(2, max_n)
+        seed = rng.randrange(2 ** 32)
+        yield (f"{distribution} n={n} seed={seed}",
+               generate_array(distribution, n, seed, -1000, 1000).tolist())
+    yield "negative values", [rng.randint(-10 ** 6, -1) for _ in range(max_n)]
+    yield "two values", [rng.choice((0, 1)) for _ in range(max_n)]
+    yield "min and max repeated", [rng.choice((-10 ** 5, 10 ** 5)) for _ in range(max_n)]
+    for _ in range(trials):
+        n = rng.randint(0, max_n)
+        spread = rng.choice((1, 10, n + 1, 10 ** 6))
+        yield f"random n={n} spread={spread}", [rng.randint(-spread, spread) for _ in range(n)]
+
+
+def fuzz(names=None, trials=50, max_n=2000, seed=None, out=sys.stdout):
+    """
+    Verify every selected algorithm (NumPy variants included) on the fuzz
+    cases. Returns the number of failures, each of which is printed.
+    """
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    algorithms = [(name, fn) for name, _, fn in ALGORITHMS + numpy_algorithms()
+                  if names is None or name in names]
+    print(f"fuzzing {len(algorithms)} algorithms, seed {seed}", file=out)
+    cases = list(fuzz_cases(trials, max_n, random.Random(seed)))
+    failures = 0
+    for name, sort_fn in algorithms:
+        backend = backend_of(sort_fn)
+        for description, values in cases:
+            checks = [("values", sort_fn, make_input(values, backend), {})]
+            if backend == "python":
+                records = [(value, i) for i, value in enumerate(values)]
+                checks.append(("key=", partial(sort_fn, key=itemgetter(0)), records,
+                               {"key": itemgetter(0), "stable": True}))
+                if sort_fn in STABLE_SORTS:
+                    tagged = [Record(value, i) for i, value in enumerate(values)]
+                    checks.append(("records", sort_fn, tagged,
+                                   {"key": lambda r: r.value, "stable": True}))
+            for workload, fn, data, options in checks:
+                sample = data.copy()
+                try:
+                    output = fn(sample)
+                    reason = verify(data, sample if output is None else output, **options)
+                except Exception as error:
+                    reason = f"raised {type(error).__name__}: {error}"
+                if reason:
+                    failures += 1
+                    print(f"FAIL {name} [{workload}] on {description}: {reason}", file=out)
+    print(f"{failures} failure(s) in {len(algorithms) * len(cases)} cases", file=out)
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fuzz the sorting algorithms and verify their output.")
+    parser.add_argument("algorithms", nargs="*", help="display names (default: all)")
+    parser.add_argument("--trials", type=int, default=50, help="random inputs per algorithm")
+    parser.add_argument("--max-n", type=int, default=2000, help="largest input size")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    sys.exit(1 if fuzz(args.algorithms or None, args.trials, args.max_n, args.seed) else 0)